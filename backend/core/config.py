@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -10,8 +11,13 @@ class Settings(BaseSettings):
     TESTING: bool = False
 
     DATABASE_URL: str = "sqlite:////app/data/listify.db"
+    # Connection pool and asyncpg statement caches (PostgreSQL only)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_STATEMENT_CACHE_SIZE: int = 1024
 
-    @property
+    @cached_property
     def database_url_async(self) -> str:
         """Convert sync DB URL to async version with appropriate driver."""
         url = self.DATABASE_URL
@@ -26,9 +32,18 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "secret_key"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # bcrypt work factor: each step doubles the hashing time
+    BCRYPT_ROUNDS: int = 12
 
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000,http://localhost"
 
+    @cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        """Parse the comma-separated CORS origins once."""
+        return tuple(
+            origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()
+        )
+
     COOKIE_SECURE: bool = False
     COOKIE_DOMAIN: Optional[str] = None
     COOKIE_SAMESITE: str = "lax"
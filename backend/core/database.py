@@ -1,17 +1,51 @@
+from enum import Enum
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession, async_sessionmaker,
+                                    create_async_engine)
+from sqlalchemy.orm import DeclarativeBase
 
 from .config import settings
 
+if "sqlite" in settings.DATABASE_URL:
+    engine_options = {"connect_args": {"check_same_thread": False}}
+else:
+    # Sized for concurrent requests; the statement caches let asyncpg prepare
+    # the prebuilt CRUD queries once per connection and reuse them
+    engine_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "connect_args": {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    }
+
+
+
+def enable_sqlite_foreign_keys(engine: AsyncEngine) -> None:
+    """
+    Turn on foreign key enforcement for every SQLite connection, so the
+    ON DELETE CASCADE rules apply as they do on PostgreSQL.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 async_engine = create_async_engine(
     settings.database_url_async,
-    connect_args=(
-        {"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
-    ),
     echo=settings.DEBUG,
+    **engine_options,
 )
+if "sqlite" in settings.DATABASE_URL:
+    enable_sqlite_foreign_keys(async_engine)
 
 AsyncSessionLocal = async_sessionmaker(
     async_engine,
@@ -20,7 +54,23 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base for all ORM models."""
+
+
+def string_enum(enum: type[Enum], constraint_name: str) -> SQLEnum:
+    """
+    Enum column stored as VARCHAR with a CHECK constraint rather than a native
+    PostgreSQL ENUM: filters compare plain strings, and a new member needs no
+    ALTER TYPE.
+    """
+    return SQLEnum(
+        enum,
+        native_enum=False,
+        create_constraint=True,
+        length=16,
+        name=constraint_name,
+    )
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
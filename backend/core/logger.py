@@ -30,8 +30,13 @@ def setup_logger(name: str = "listify") -> None:
             structlog.processors.JSONRenderer()
         ])
 
+    log_level = logging.DEBUG if settings.DEBUG else logging.INFO
+
     structlog.configure(
         processors=processors,
+        # Calls below the level return immediately, before any formatting;
+        # %-style arguments are only interpolated for emitted events
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
     )
@@ -40,7 +45,7 @@ def setup_logger(name: str = "listify") -> None:
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=logging.DEBUG if settings.DEBUG else logging.INFO,
+        level=log_level,
     )
 
 
@@ -1,15 +1,16 @@
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
 import bcrypt
-from jose import JWTError, jwt
+import jwt
 
 from .config import settings
 
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
@@ -21,6 +22,17 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash at the configured cost that no real account uses."""
+    return hash_password("not-a-real-password")
+
+
+def verify_dummy_password(plain_password: str) -> bool:
+    """Do the work of a failed verify for a login with no matching user."""
+    return verify_password(plain_password, _dummy_password_hash())
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -46,5 +58,5 @@ def decode_access_token(token: str) -> Optional[dict]:
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
@@ -1,16 +1,55 @@
-from typing import Any, Generic, List, Optional, Type, TypeVar
+from typing import Any, Generic, List, Optional, Tuple, Type, TypeVar
 
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, load_only, selectinload
 
+from core.cache import cache
 from core.database import Base
 from core.logger import get_logger
+from models import MediaTypeEnum
 
 logger = get_logger("crud")
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+def is_postgresql(db: AsyncSession) -> bool:
+    """Check whether the session is bound to a PostgreSQL database"""
+    return db.bind is not None and db.bind.dialect.name == "postgresql"
+
+
+# INSERT constructs that support ON CONFLICT, per dialect name
+_CONFLICT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def conflict_insert(db: AsyncSession, model: Type[ModelType]):
+    """INSERT for the session's dialect that supports on_conflict_do_nothing"""
+    dialect = db.bind.dialect.name if db.bind is not None else None
+    if dialect not in _CONFLICT_INSERTS:
+        raise NotImplementedError(f"ON CONFLICT is not supported on {dialect}")
+    return _CONFLICT_INSERTS[dialect](model)
+
+
+def statistics_cache_key(
+    user_id: int, media_type: Optional[MediaTypeEnum] = None
+) -> str:
+    """Cache key of a user's tracking statistics, per media type or overall"""
+    return f"stats:{user_id}:{media_type.value if media_type else 'all'}"
+
+
+async def invalidate_statistics(user_id: int) -> None:
+    """
+    Drop the user's cached statistics, for every media type. Called after any
+    write that changes the user's tracking rows, including cascades.
+    """
+    await cache.clear_pattern(f"stats:{user_id}:*")
+
+
 class CRUDBase(Generic[ModelType]):
     """Base CRUD operations"""
 
@@ -19,54 +58,80 @@ class CRUDBase(Generic[ModelType]):
 
     async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
         """Get a single record by ID"""
-        logger.debug(f"Getting {self.model.__name__} with id: {id}")
+        logger.debug("Getting %s with id: %s", self.model.__name__, id)
         result = await db.execute(select(self.model).filter(self.model.id == id))
         return result.scalar_one_or_none()
 
     async def get_multi(
-        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        only: Tuple[InstrumentedAttribute, ...] = (),
+        selectin: Tuple[InstrumentedAttribute, ...] = (),
     ) -> List[ModelType]:
-        """Get multiple records"""
+        """
+        Get multiple records.
+        - only: columns to load, the rest are deferred.
+        - selectin: relationships to eager-load with SELECT ... IN.
+        - after_id: keyset cursor; when given, skip is ignored.
+        """
         logger.debug(
-            f"Getting {self.model.__name__} records (skip: {skip}, limit: {limit})"
+            "Getting %s records (skip: %s, after_id: %s, limit: %s)",
+            self.model.__name__,
+            skip,
+            after_id,
+            limit,
         )
-        result = await db.execute(select(self.model).offset(skip).limit(limit))
+        options = [selectinload(rel) for rel in selectin]
+        if only:
+            options.append(load_only(*only))
+
+        stmt = select(self.model).options(*options)
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id).order_by(self.model.id)
+        else:
+            stmt = stmt.offset(skip)
+
+        result = await db.execute(stmt.limit(limit))
         return list(result.scalars().all())
 
     async def create(
         self, db: AsyncSession, *args, obj_in: dict, **kwargs
     ) -> ModelType:
         """Create a new record"""
-        logger.info(f"Creating {self.model.__name__}")
+        logger.info("Creating %s", self.model.__name__)
         db_obj = self.model(**obj_in)
         db.add(db_obj)
         await db.flush()
         await db.refresh(db_obj)
-        logger.debug(f"Created {self.model.__name__} with id: {db_obj.id}")
+        logger.debug("Created %s with id: %s", self.model.__name__, db_obj.id)
         return db_obj
 
     async def update(
         self, db: AsyncSession, *, db_obj: ModelType, obj_in: dict
     ) -> ModelType:
         """Update a record"""
-        logger.info(f"Updating {self.model.__name__} with id: {db_obj.id}")
+        logger.info("Updating %s with id: %s", self.model.__name__, db_obj.id)
         for field, value in obj_in.items():
             if value is not None:
                 setattr(db_obj, field, value)
         db.add(db_obj)
         await db.flush()
         await db.refresh(db_obj)
-        logger.debug(f"Updated {self.model.__name__} with id: {db_obj.id}")
+        logger.debug("Updated %s with id: %s", self.model.__name__, db_obj.id)
         return db_obj
 
     async def delete(self, db: AsyncSession, *, id: Any) -> bool:
         """Delete a record"""
-        logger.info(f"Deleting {self.model.__name__} with id: {id}")
+        logger.info("Deleting %s with id: %s", self.model.__name__, id)
         obj = await db.get(self.model, id)
         if obj:
             await db.delete(obj)
             await db.flush()
-            logger.debug(f"Deleted {self.model.__name__} with id: {id}")
+            logger.debug("Deleted %s with id: %s", self.model.__name__, id)
             return True
-        logger.warning(f"{self.model.__name__} not found with id: {id}")
+        logger.warning("%s not found with id: %s", self.model.__name__, id)
         return False
@@ -1,56 +1,197 @@
+import asyncio
+from functools import lru_cache, partialmethod
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import Dict, FrozenSet, List, Optional, Type
 
 from pydantic import BaseModel
-from sqlalchemy import or_, select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import bindparam, delete, func, inspect, literal_column, or_, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from core.cache import cache
 from core.exceptions import AlreadyExists, PermissionDenied
 from models import (Anime, Book, Game, Manga, Media, MediaTag, MediaTypeEnum,
                     Movie, Series, Tag, Tracking)
 
-from .base import CRUDBase, logger
+from .base import CRUDBase, invalidate_statistics, is_postgresql, logger
 from .tag import tag_crud
 
 logger = logger.bind(module="media")
 
+# Weighted, generated tsvector column on PostgreSQL (see migrations
+# 3f9a1c2d7b64 and 7e2d4b9c1a36), intentionally not mapped so it is never
+# loaded with the row
+SEARCH_VECTOR = literal_column("media.search_vec")
+SEARCH_TS_CONFIG = "english"
+
+LIKE_ESCAPE = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+# pg_trgm cannot serve substring matches shorter than one trigram
+MIN_SUBSTRING_QUERY_LENGTH = 3
+
+# Local cover image URLs are resolved relative to this directory
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Keeps IN lists well below driver bind-parameter limits
+CLEANUP_BATCH_SIZE = 500
+# Cover image unlinks in flight at once during cleanup
+COVER_UNLINK_CONCURRENCY = 32
+
+
+@lru_cache(maxsize=None)
+def _writable_fields(model_class: Type[Media]) -> FrozenSet[str]:
+    """Mapped column attribute names of a media class, computed once per class"""
+    return frozenset(attr.key for attr in inspect(model_class).column_attrs)
+
+
+@lru_cache(maxsize=None)
+def _dump_fields(
+    schema_class: Type[BaseModel], model_class: Type[Media]
+) -> FrozenSet[str]:
+    """Schema fields that map onto columns of the media class (tags never do)"""
+    return frozenset(schema_class.model_fields) & _writable_fields(model_class)
+
+
+MODEL_MAP: Dict[MediaTypeEnum, Type[Media]] = {
+    MediaTypeEnum.MOVIE: Movie,
+    MediaTypeEnum.SERIES: Series,
+    MediaTypeEnum.ANIME: Anime,
+    MediaTypeEnum.MANGA: Manga,
+    MediaTypeEnum.BOOK: Book,
+    MediaTypeEnum.GAME: Game,
+}
+
+# Each member carries its class, so resolving it is an attribute load
+for _media_type, _model_class in MODEL_MAP.items():
+    _media_type.model_class = _model_class
+
 
 class CRUDMedia(CRUDBase[Media]):
     """CRUD operations for media with polymorphic support"""
 
-    MODEL_MAP = {
-        MediaTypeEnum.MOVIE: Movie,
-        MediaTypeEnum.SERIES: Series,
-        MediaTypeEnum.ANIME: Anime,
-        MediaTypeEnum.MANGA: Manga,
-        MediaTypeEnum.BOOK: Book,
-        MediaTypeEnum.GAME: Game,
-    }
+    MODEL_MAP = MODEL_MAP
+
+    def __init__(self, model: Type[Media]):
+        super().__init__(model)
+
+        # Hot lookups are built once and executed with bound parameters.
+        # get_by_id is keyed by (load_tags, media_type); a known type selects
+        # its subclass, joining one subtype table instead of all of them
+        self._get_by_id_stmts = {}
+        for load_tags in (True, False):
+            for media_type, model_class in [(None, Media), *self.MODEL_MAP.items()]:
+                stmt = select(model_class).where(Media.id == bindparam("id"))
+                if load_tags:
+                    # A single row: joining the tags in costs less than the two
+                    # extra round-trips of selectinload
+                    stmt = stmt.options(
+                        joinedload(model_class.tag_associations).joinedload(
+                            MediaTag.tag
+                        )
+                    )
+                self._get_by_id_stmts[load_tags, media_type] = stmt
+        # The external key covers media_external_uidx, so it resolves with an
+        # index probe on media plus one subtype table, tags joined in
+        self._get_by_external_id_stmts = {
+            media_type: select(model_class)
+            .options(
+                joinedload(model_class.tag_associations).joinedload(MediaTag.tag)
+            )
+            .where(
+                Media.external_id == bindparam("external_id"),
+                Media.external_source == bindparam("external_source"),
+                Media.media_type == media_type,
+            )
+            for media_type, model_class in self.MODEL_MAP.items()
+        }
+        # Listing bases share the same keys; filters are added per call
+        self._select_media_stmts = {}
+        for load_tags in (True, False):
+            for media_type, model_class in [(None, Media), *self.MODEL_MAP.items()]:
+                stmt = select(model_class)
+                if load_tags:
+                    # Media carry a handful of tags, so a typed listing joins
+                    # them in and makes one round-trip; a mixed one already
+                    # loads its subtypes in separate SELECTs and does the same
+                    loader = selectinload if media_type is None else joinedload
+                    # Listings only render tag names
+                    stmt = stmt.options(
+                        loader(model_class.tag_associations)
+                        .joinedload(MediaTag.tag)
+                        .load_only(Tag.id, Tag.name)
+                    )
+                self._select_media_stmts[load_tags, media_type] = stmt
 
     def _get_model_class(self, media_type: MediaTypeEnum) -> Type[Media]:
         """Get the appropriate model class for media type"""
-        return self.MODEL_MAP.get(media_type, Media)
+        return media_type.model_class
+
+    async def _invalidate_api_cache(
+        self,
+        external_source: str,
+        *,
+        external_id: Optional[str] = None,
+        search: bool = False,
+    ) -> None:
+        """
+        Drop cached API responses for a source.
+        - external_id: details responses for this item.
+        - search: all search responses for the source.
+        """
+        patterns = []
+        if external_id:
+            # We don't know the exact endpoint used, so clear patterns
+            patterns.append(f"api:{external_source}:*{external_id}*")
+        if search:
+            patterns.append(f"api:{external_source}:search:*")
+        await asyncio.gather(*(cache.clear_pattern(p) for p in patterns))
+
+    def _select_media(
+        self, load_tags: bool = True, media_type: Optional[MediaTypeEnum] = None
+    ):
+        """Base media SELECT for listings, eager-loading tags only when asked to"""
+        # A known type selects its subclass and joins one subtype table; a
+        # mixed listing reads media, then each subtype present with SELECT ... IN
+        return self._select_media_stmts[load_tags, media_type or None]
 
     async def get_by_id(
-        self, db: AsyncSession, *, id: int, media_type: Optional[MediaTypeEnum] = None
+        self,
+        db: AsyncSession,
+        *,
+        id: int,
+        media_type: Optional[MediaTypeEnum] = None,
+        load_tags: bool = True,
     ) -> Optional[Media]:
         """Get media by ID, optionally filtered by type"""
-        logger.debug(f"Getting media with id: {id}, type: {media_type}")
+        logger.debug("Getting media with id: %s, type: %s", id, media_type)
 
-        stmt = (
-            select(Media)
-            .options(selectinload(Media.tag_associations).selectinload(MediaTag.tag))
-            .filter(Media.id == id)
-        )
+        stmt = self._get_by_id_stmts[load_tags, media_type or None]
+
+        result = await db.execute(stmt, {"id": id})
+        return result.unique().scalar_one_or_none()
 
+    async def get_by_ids(
+        self,
+        db: AsyncSession,
+        *,
+        ids: List[int],
+        media_type: Optional[MediaTypeEnum] = None,
+        load_tags: bool = True,
+    ) -> Dict[int, Media]:
+        """Get many media by ID in one query, keyed by ID; missing IDs are absent"""
+        logger.debug("Getting %d media by id, type: %s", len(ids), media_type)
+        if not ids:
+            return {}
+
+        stmt = self._select_media(load_tags, media_type).where(
+            Media.id.in_(set(ids))
+        )
         if media_type:
             stmt = stmt.filter(Media.media_type == media_type)
 
         result = await db.execute(stmt)
-        return result.scalar_one_or_none()
+        return {media.id: media for media in result.unique().scalars().all()}
 
     async def get_all(
         self,
@@ -59,21 +200,33 @@ class CRUDMedia(CRUDBase[Media]):
         media_type: Optional[MediaTypeEnum] = None,
         skip: int = 0,
         limit: int = 100,
+        after_id: Optional[int] = None,
+        load_tags: bool = True,
     ) -> List[Media]:
-        """Get all media, optionally filtered by type"""
+        """
+        Get all media, optionally filtered by type.
+        - after_id: keyset cursor; when given, skip is ignored.
+        """
         logger.debug(
-            f"Getting all media (type: {media_type}, skip: {skip}, limit: {limit})"
+            "Getting all media (type: %s, skip: %s, after_id: %s, limit: %s)",
+            media_type,
+            skip,
+            after_id,
+            limit,
         )
 
-        stmt = select(Media).options(
-            selectinload(Media.tag_associations).selectinload(MediaTag.tag)
-        )
+        stmt = self._select_media(load_tags, media_type).order_by(Media.id)
 
         if media_type:
             stmt = stmt.filter(Media.media_type == media_type)
 
-        result = await db.execute(stmt.offset(skip).limit(limit))
-        return list(result.scalars().all())
+        if after_id is not None:
+            stmt = stmt.filter(Media.id > after_id)
+        else:
+            stmt = stmt.offset(skip)
+
+        result = await db.execute(stmt.limit(limit))
+        return list(result.unique().scalars().all())
 
     async def search(
         self,
@@ -82,27 +235,51 @@ class CRUDMedia(CRUDBase[Media]):
         query: str,
         media_type: Optional[MediaTypeEnum] = None,
         limit: int = 100,
+        load_tags: bool = True,
     ) -> List[Media]:
         """Search media by title or description"""
-        logger.info(f"Searching media for: {query} (type: {media_type})")
-
-        stmt = (
-            select(Media)
-            .options(selectinload(Media.tag_associations).selectinload(MediaTag.tag))
-            .filter(
-                or_(
-                    Media.title.ilike(f"%{query}%"),
-                    Media.description.ilike(f"%{query}%"),
-                )
+        logger.info("Searching media for: %s (type: %s)", query, media_type)
+
+        stmt = self._select_media(load_tags, media_type)
+        postgresql = is_postgresql(db)
+        ranking = []
+
+        if postgresql and "%" not in query and "_" not in query:
+            # Full-text match (GIN index on media.search_vec) or a fuzzy title
+            # match with the pg_trgm % operator (GIN index media_title_trgm)
+            ts_query = func.websearch_to_tsquery(SEARCH_TS_CONFIG, query)
+            stmt = stmt.filter(
+                or_(SEARCH_VECTOR.op("@@")(ts_query), Media.title.op("%")(query))
             )
-        )
+            # Title lexemes are weighted above description ones
+            ranking.append(func.ts_rank(SEARCH_VECTOR, ts_query).desc())
+        else:
+            # User input is matched literally, never as LIKE wildcards
+            escaped = query.translate(LIKE_ESCAPE)
+            if len(query) < MIN_SUBSTRING_QUERY_LENGTH:
+                # Too short for the trigram indexes; match title prefixes only
+                stmt = stmt.filter(Media.title.ilike(f"{escaped}%", escape="\\"))
+            else:
+                pattern = f"%{escaped}%"
+                stmt = stmt.filter(
+                    or_(
+                        Media.title.ilike(pattern, escape="\\"),
+                        Media.description.ilike(pattern, escape="\\"),
+                    )
+                )
 
         if media_type:
             stmt = stmt.filter(Media.media_type == media_type)
 
+        if postgresql:
+            # Best full-text matches first, then the closest titles
+            stmt = stmt.order_by(
+                *ranking, func.similarity(Media.title, query).desc(), Media.id
+            )
+
         result = await db.execute(stmt.limit(limit))
-        results = list(result.scalars().all())
-        logger.debug(f"Search returned {len(results)} results")
+        results = list(result.unique().scalars().all())
+        logger.debug("Search returned %d results", len(results))
         return results
 
     async def get_by_external_id(
@@ -115,16 +292,16 @@ class CRUDMedia(CRUDBase[Media]):
     ) -> Optional[Media]:
         """Get media by external ID and source"""
         logger.debug(
-            f"Checking for existing media: external_id={external_id}, "
-            f"source={external_source}, type={media_type}"
+            "Checking for existing media: external_id=%s, source=%s, type=%s",
+            external_id,
+            external_source,
+            media_type,
         )
-        stmt = select(Media).filter(
-            Media.external_id == external_id,
-            Media.external_source == external_source,
-            Media.media_type == media_type,
+        result = await db.execute(
+            self._get_by_external_id_stmts[media_type],
+            {"external_id": external_id, "external_source": external_source},
         )
-        result = await db.execute(stmt)
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
 
     async def _create_with_tags(
         self,
@@ -137,26 +314,15 @@ class CRUDMedia(CRUDBase[Media]):
     ) -> Media:
         """Create media with automatic tag handling"""
         try:
-            obj_data = obj_in.model_dump(exclude_unset=True)
-            tags = obj_data.pop("tags", None)
+            # Only column fields are dumped; tags are stored separately
+            obj_data = obj_in.model_dump(
+                include=_dump_fields(type(obj_in), model_class), exclude_unset=True
+            )
+            tags = getattr(obj_in, "tags", None)
 
             external_id = obj_data.get("external_id")
             external_source = obj_data.get("external_source")
 
-            if external_id and external_source:
-                existing_media = await self.get_by_external_id(
-                    db,
-                    external_id=external_id,
-                    external_source=external_source,
-                    media_type=media_type,
-                )
-                if existing_media:
-                    logger.info(
-                        f"Found existing {media_type.value} with external_id={external_id}, "
-                        f"returning existing media with id: {existing_media.id}"
-                    )
-                    return existing_media
-
             is_custom = obj_data.get("is_custom", False)
             if is_custom and user_id:
                 # Duplicate check for custom media
@@ -164,7 +330,7 @@ class CRUDMedia(CRUDBase[Media]):
                     Media.is_custom == True,
                     Media.created_by_id == user_id,
                     Media.media_type == media_type,
-                    Media.title.ilike(obj_data["title"]),
+                    func.lower(Media.title) == func.lower(obj_data["title"]),
                 )
 
                 release_date = obj_data.get("release_date")
@@ -183,36 +349,54 @@ class CRUDMedia(CRUDBase[Media]):
                 obj_data["created_by_id"] = user_id
 
             logger.info(
-                f"Creating {media_type.value}: {obj_data.get('title', 'Unknown')}"
+                "Creating %s: %s", media_type.value, obj_data.get("title", "Unknown")
             )
             media = model_class(**obj_data)
-            db.add(media)
-            await db.flush()  # Get the ID without committing
+            try:
+                # A savepoint, so a rejected row is undone without discarding
+                # the rest of the caller's transaction
+                async with db.begin_nested():
+                    db.add(media)
+                    await db.flush()  # Get the ID without committing
+            except IntegrityError:
+                if not (external_id and external_source):
+                    raise
+                # media_external_uidx rejected the row: it is already stored,
+                # so hand back the existing media instead of a pre-insert SELECT
+                existing_media = await self.get_by_external_id(
+                    db,
+                    external_id=external_id,
+                    external_source=external_source,
+                    media_type=media_type,
+                )
+                if not existing_media:
+                    raise
+                logger.info(
+                    "Found existing %s with external_id=%s, "
+                    "returning existing media with id: %s",
+                    media_type.value,
+                    external_id,
+                    existing_media.id,
+                )
+                return existing_media
 
+            associations = []
             if tags:
-                await tag_crud.add_tags_to_media(
+                associations = await tag_crud.link_tags(
                     db, media_id=media.id, media_type=media_type, tag_names=tags
                 )
 
             await db.commit()
 
-            await db.refresh(media)
+            # The session keeps attributes after commit and the associations
+            # written above are the complete collection, so no reload is needed
+            set_committed_value(media, "tag_associations", associations)
 
             # Invalidate search cache for this source
             if external_source:
-                await cache.clear_pattern(f"api:{external_source}:search:*")
-
-            stmt = (
-                select(model_class)
-                .options(
-                    selectinload(Media.tag_associations).selectinload(MediaTag.tag)
-                )
-                .where(Media.id == media.id)
-            )
-            result = await db.execute(stmt)
-            media = result.scalar_one()
+                await self._invalidate_api_cache(external_source, search=True)
 
-            logger.debug(f"Created {media_type.value} with id: {media.id}")
+            logger.debug("Created %s with id: %s", media_type.value, media.id)
             return media
 
         except Exception as e:
@@ -220,78 +404,6 @@ class CRUDMedia(CRUDBase[Media]):
             logger.error(f"Error creating {media_type.value}: {str(e)}")
             raise
 
-    async def create_movie(
-        self, db: AsyncSession, *, obj_in: BaseModel, user_id: Optional[int] = None
-    ) -> Movie:
-        """Create a movie"""
-        return await self._create_with_tags(
-            db,
-            model_class=Movie,
-            obj_in=obj_in,
-            media_type=MediaTypeEnum.MOVIE,
-            user_id=user_id,
-        )
-
-    async def create_series(
-        self, db: AsyncSession, *, obj_in: BaseModel, user_id: Optional[int] = None
-    ) -> Series:
-        """Create a series"""
-        return await self._create_with_tags(
-            db,
-            model_class=Series,
-            obj_in=obj_in,
-            media_type=MediaTypeEnum.SERIES,
-            user_id=user_id,
-        )
-
-    async def create_anime(
-        self, db: AsyncSession, *, obj_in: BaseModel, user_id: Optional[int] = None
-    ) -> Anime:
-        """Create an anime"""
-        return await self._create_with_tags(
-            db,
-            model_class=Anime,
-            obj_in=obj_in,
-            media_type=MediaTypeEnum.ANIME,
-            user_id=user_id,
-        )
-
-    async def create_manga(
-        self, db: AsyncSession, *, obj_in: BaseModel, user_id: Optional[int] = None
-    ) -> Manga:
-        """Create a manga"""
-        return await self._create_with_tags(
-            db,
-            model_class=Manga,
-            obj_in=obj_in,
-            media_type=MediaTypeEnum.MANGA,
-            user_id=user_id,
-        )
-
-    async def create_book(
-        self, db: AsyncSession, *, obj_in: BaseModel, user_id: Optional[int] = None
-    ) -> Book:
-        """Create a book"""
-        return await self._create_with_tags(
-            db,
-            model_class=Book,
-            obj_in=obj_in,
-            media_type=MediaTypeEnum.BOOK,
-            user_id=user_id,
-        )
-
-    async def create_game(
-        self, db: AsyncSession, *, obj_in: BaseModel, user_id: Optional[int] = None
-    ) -> Game:
-        """Create a game"""
-        return await self._create_with_tags(
-            db,
-            model_class=Game,
-            obj_in=obj_in,
-            media_type=MediaTypeEnum.GAME,
-            user_id=user_id,
-        )
-
     def can_modify_media(self, media: Media, user_id: int) -> bool:
         """Check if user can modify this media"""
         if not media.is_custom:
@@ -311,170 +423,124 @@ class CRUDMedia(CRUDBase[Media]):
         media_type = media.media_type
 
         try:
-            logger.info(f"Updating {media_type.value} with id: {media_id}")
+            logger.info("Updating %s with id: %s", media_type.value, media_id)
 
             if user_id and not self.can_modify_media(media, user_id):
                 logger.warning(f"User {user_id} not allowed to modify media {media_id}")
                 raise PermissionDenied("Cannot modify this media")
 
+            # Fields the media class has no column for are never dumped
             obj_data = obj_in.model_dump(
-                exclude_unset=True, exclude_none=True
-            )  # Added exclude_none
-            tags = obj_data.pop("tags", None)
+                include=_dump_fields(type(obj_in), type(media)),
+                exclude_unset=True,
+                exclude_none=True,
+            )
+            tags = getattr(obj_in, "tags", None)
 
             for field, value in obj_data.items():
-                if hasattr(media, field):  # Safety check
+                if getattr(media, field) != value:
+                    # Unchanged values are not set, so the instance only turns
+                    # dirty when the UPDATE would actually change something
                     setattr(media, field, value)
-                else:
-                    logger.warning(
-                        f"Field {field} does not exist on {type(media).__name__}"
-                    )
 
-            db.add(media)
-            await db.flush()
+            if tags is None and not inspect(media).modified:
+                logger.debug("No changes for %s with id: %s", media_type.value, media_id)
+                return media
 
+            # Field changes are flushed by the commit below, together with
+            # any tag changes
+            associations = None
             if tags is not None:
-                await tag_crud.update_media_tags(
+                # Replace the tag set in the same transaction as the update
+                associations = await tag_crud.sync_tags(
                     db, media_id=media_id, media_type=media_type, tag_names=tags
                 )
 
             await db.commit()
 
+            if associations is not None:
+                # Tag rows were replaced behind the ORM's back; the new
+                # associations are the complete collection
+                set_committed_value(media, "tag_associations", associations)
+
             # Invalidate details cache for this item
             if media.external_id and media.external_source:
-                # We don't know the exact endpoint used, so clear patterns
-                await cache.clear_pattern(f"api:{media.external_source}:*{media.external_id}*")
-
-            stmt = (
-                select(type(media))
-                .options(
-                    selectinload(Media.tag_associations).selectinload(MediaTag.tag)
+                await self._invalidate_api_cache(
+                    media.external_source, external_id=media.external_id
                 )
-                .where(Media.id == media_id)
-            )
-            result = await db.execute(stmt)
-            updated_media = result.scalar_one()
 
-            logger.debug(
-                f"Updated {media_type.value} with id: {updated_media.id}"
-            )
-            return updated_media
+            logger.debug("Updated %s with id: %s", media_type.value, media_id)
+            return media
 
         except Exception as e:
             await db.rollback()
             logger.error(f"Error updating media {media_id}: {str(e)}")
             raise
 
-    async def update_movie(
-        self,
-        db: AsyncSession,
-        *,
-        id: int,
-        obj_in: BaseModel,
-        user_id: Optional[int] = None,
-    ) -> Optional[Movie]:
-        """Update a movie"""
-        movie = await self.get_by_id(db, id=id, media_type=MediaTypeEnum.MOVIE)
-        if not movie:
-            logger.warning(f"Movie not found with id: {id}")
-            return None
-        return await self._update_with_tags(
-            db, media=movie, obj_in=obj_in, user_id=user_id
-        )
-
-    async def update_series(
-        self,
-        db: AsyncSession,
-        *,
-        id: int,
-        obj_in: BaseModel,
-        user_id: Optional[int] = None,
-    ) -> Optional[Series]:
-        """Update a series"""
-        series = await self.get_by_id(db, id=id, media_type=MediaTypeEnum.SERIES)
-        if not series:
-            logger.warning(f"Series not found with id: {id}")
-            return None
-        return await self._update_with_tags(
-            db, media=series, obj_in=obj_in, user_id=user_id
-        )
-
-    async def update_anime(
-        self,
-        db: AsyncSession,
-        *,
-        id: int,
-        obj_in: BaseModel,
-        user_id: Optional[int] = None,
-    ) -> Optional[Anime]:
-        """Update an anime"""
-        anime = await self.get_by_id(db, id=id, media_type=MediaTypeEnum.ANIME)
-        if not anime:
-            logger.warning(f"Anime not found with id: {id}")
-            return None
-        return await self._update_with_tags(
-            db, media=anime, obj_in=obj_in, user_id=user_id
-        )
-
-    async def update_manga(
+    async def _update_by_id(
         self,
         db: AsyncSession,
         *,
         id: int,
         obj_in: BaseModel,
+        media_type: MediaTypeEnum,
         user_id: Optional[int] = None,
-    ) -> Optional[Manga]:
-        """Update a manga"""
-        manga = await self.get_by_id(db, id=id, media_type=MediaTypeEnum.MANGA)
-        if not manga:
-            logger.warning(f"Manga not found with id: {id}")
-            return None
-        return await self._update_with_tags(
-            db, media=manga, obj_in=obj_in, user_id=user_id
+    ) -> Optional[Media]:
+        """Look up media of the given type and update it"""
+        # New tags are reloaded after the update, so only preload them when
+        # the existing ones will be returned as-is
+        media = await self.get_by_id(
+            db,
+            id=id,
+            media_type=media_type,
+            load_tags=getattr(obj_in, "tags", None) is None,
         )
-
-    async def update_book(
-        self,
-        db: AsyncSession,
-        *,
-        id: int,
-        obj_in: BaseModel,
-        user_id: Optional[int] = None,
-    ) -> Optional[Book]:
-        """Update a book"""
-        book = await self.get_by_id(db, id=id, media_type=MediaTypeEnum.BOOK)
-        if not book:
-            logger.warning(f"Book not found with id: {id}")
+        if not media:
+            logger.warning(f"{media_type.value.capitalize()} not found with id: {id}")
             return None
         return await self._update_with_tags(
-            db, media=book, obj_in=obj_in, user_id=user_id
+            db, media=media, obj_in=obj_in, user_id=user_id
         )
 
-    async def update_game(
-        self,
-        db: AsyncSession,
-        *,
-        id: int,
-        obj_in: BaseModel,
-        user_id: Optional[int] = None,
-    ) -> Optional[Game]:
-        """Update a game"""
-        game = await self.get_by_id(db, id=id, media_type=MediaTypeEnum.GAME)
-        if not game:
-            logger.warning(f"Game not found with id: {id}")
-            return None
-        return await self._update_with_tags(
-            db, media=game, obj_in=obj_in, user_id=user_id
-        )
+    async def _delete_cover_image(self, cover_image_url: Optional[str]) -> None:
+        """Remove a locally uploaded cover image, never blocking DB deletion"""
+        if not cover_image_url or not cover_image_url.startswith("/static/images/"):
+            return
+        try:
+            file_path = PROJECT_ROOT / cover_image_url.lstrip("/")
+
+            # Filesystem calls run in a worker thread to keep the event loop free
+            if await asyncio.to_thread(file_path.is_file):
+                logger.info("Deleting local image file: %s", file_path)
+                await asyncio.to_thread(file_path.unlink, missing_ok=True)
+        except (PermissionError, OSError) as e:
+            # Log warning but don't block DB deletion
+            logger.warning(f"Could not delete file {cover_image_url} (permission/OS error): {str(e)}")
+        except Exception as e:
+            # Log error but don't block DB deletion
+            logger.error(f"Unexpected error deleting file {cover_image_url}: {str(e)}")
 
     async def delete(
         self, db: AsyncSession, *, id: int, user_id: Optional[int] = None, commit: bool = True
     ) -> bool:
         """Delete media by ID"""
+        media_table = Media.__table__
         try:
-            logger.info(f"Attempting to delete media with id: {id}")
-
-            media = await self.get_by_id(db, id=id)
+            logger.info("Attempting to delete media with id: %s", id)
+
+            # Only the columns the permission check and cleanup need, read
+            # from the base table: a rejected request costs this one query
+            result = await db.execute(
+                select(
+                    media_table.c.media_type,
+                    media_table.c.is_custom,
+                    media_table.c.created_by_id,
+                    media_table.c.cover_image_url,
+                    media_table.c.external_id,
+                    media_table.c.external_source,
+                ).where(media_table.c.id == id)
+            )
+            media = result.one_or_none()
             if not media:
                 logger.warning(f"Media not found with id: {id}")
                 return False
@@ -483,37 +549,37 @@ class CRUDMedia(CRUDBase[Media]):
                 logger.warning(f"User {user_id} not allowed to delete media {id}")
                 raise PermissionDenied("Cannot delete this media")
 
-            # File cleanup logic
-            if media.cover_image_url and media.cover_image_url.startswith("/static/images/"):
-                try:
-                    # Resolve path relative to project root
-                    base_path = Path(__file__).resolve().parent.parent.parent
-                    relative_path = media.cover_image_url.lstrip("/")
-                    file_path = base_path / relative_path
-
-                    if file_path.is_file():
-                        logger.info(f"Deleting local image file: {file_path}")
-                        file_path.unlink(missing_ok=True)
-                except (PermissionError, OSError) as e:
-                    # Log warning but don't block DB deletion
-                    logger.warning(f"Could not delete file {media.cover_image_url} (permission/OS error): {str(e)}")
-                except Exception as e:
-                    # Log error but don't block DB deletion
-                    logger.error(f"Unexpected error deleting file {media.cover_image_url}: {str(e)}")
-
-            external_id = media.external_id
-            external_source = media.external_source
+            # Pending ORM changes (e.g. a tracking entry the caller removed)
+            # must reach the database before the set-based deletes below
+            await db.flush()
 
-            await db.delete(media)
+            # Set-based deletes instead of loading the row and its
+            # collections for the ORM cascade. Tracking entries and tag links
+            # go through ON DELETE CASCADE; the subtype row has none
+            subtype_table = media.media_type.model_class.__table__
+            await db.execute(delete(subtype_table).where(subtype_table.c.id == id))
+            await db.execute(delete(media_table).where(media_table.c.id == id))
             if commit:
                 await db.commit()
 
+            # ON DELETE CASCADE removed the tracking rows; the owner sees that
+            # on their next statistics request, others within the TTL. Without
+            # commit the caller invalidates once it has committed
+            if commit and media.created_by_id:
+                await invalidate_statistics(media.created_by_id)
+
+            await self._delete_cover_image(media.cover_image_url)
+
+            external_id = media.external_id
+            external_source = media.external_source
+
             # Invalidate cache
             if external_id and external_source:
-                await cache.clear_pattern(f"api:{external_source}:*{external_id}*")
-                await cache.clear_pattern(f"api:{external_source}:search:*")
+                await self._invalidate_api_cache(
+                    external_source, external_id=external_id, search=True
+                )
 
-            logger.info(f"Successfully deleted media with id: {id}")
+            logger.info("Successfully deleted media with id: %s", id)
             return True
 
         except SQLAlchemyError as e:
@@ -525,6 +591,36 @@ class CRUDMedia(CRUDBase[Media]):
             logger.error(f"Unexpected error deleting media {id}: {str(e)}")
             raise
 
+    async def _delete_media_rows(self, db: AsyncSession, ids: List[int]) -> list:
+        """
+        Delete media rows by ID with set-based statements and commit.
+        Returns (cover_image_url, external_id, external_source) per deleted row.
+        """
+        media_table = Media.__table__
+        try:
+            # Tag links go with the media through ON DELETE CASCADE; subtype
+            # tables reference media.id without it and are deleted first
+            for model_class in self.MODEL_MAP.values():
+                subtype_table = model_class.__table__
+                await db.execute(delete(subtype_table).where(subtype_table.c.id.in_(ids)))
+
+            result = await db.execute(
+                delete(media_table)
+                .where(media_table.c.id.in_(ids))
+                .returning(
+                    media_table.c.cover_image_url,
+                    media_table.c.external_id,
+                    media_table.c.external_source,
+                )
+            )
+            deleted_rows = result.all()
+            await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"Database error during orphaned media cleanup: {str(e)}")
+            raise
+        return deleted_rows
+
     async def cleanup_orphaned_media(self, db: AsyncSession) -> int:
         """
         Delete media that are not referenced by any tracking entries.
@@ -532,28 +628,74 @@ class CRUDMedia(CRUDBase[Media]):
         """
         logger.info("Starting orphaned media cleanup")
 
-        # Find media IDs that are NOT present in the tracking table
-        # We use a subquery for all media_ids in tracking
-        tracking_stmt = select(Tracking.media_id)
-        stmt = select(Media.id).where(Media.id.not_in(tracking_stmt))
-        
-        result = await db.execute(stmt)
-        orphaned_ids = list(result.scalars().all())
+        # Anti-join on the base table: skips the polymorphic subtype joins
+        # and lets the planner use a hash/merge anti-join
+        media_table = Media.__table__
+        tracking_table = Tracking.__table__
+        stmt = (
+            select(media_table.c.id)
+            .outerjoin(tracking_table, tracking_table.c.media_id == media_table.c.id)
+            .where(tracking_table.c.media_id.is_(None))
+            .order_by(media_table.c.id)
+            .limit(CLEANUP_BATCH_SIZE)
+        )
 
+        semaphore = asyncio.Semaphore(COVER_UNLINK_CONCURRENCY)
+
+        async def delete_cover(cover_image_url: Optional[str]) -> None:
+            async with semaphore:
+                await self._delete_cover_image(cover_image_url)
+
+        # Walk the orphans one keyset page at a time and commit each page,
+        # so memory stays bounded by the batch size
         count = 0
-        if orphaned_ids:
-            logger.info(f"Found {len(orphaned_ids)} orphaned media items to clean up")
-            for media_id in orphaned_ids:
-                # Using self.delete ensures file cleanup and cache invalidation
-                if await self.delete(db, id=media_id, commit=False):
-                    count += 1
-            
-            await db.commit()
-            logger.info(f"Successfully cleaned up {count} orphaned media items")
-        else:
+        last_id = 0
+        external_sources = set()
+        while True:
+            result = await db.execute(stmt.where(media_table.c.id > last_id))
+            batch = list(result.scalars().all())
+            if not batch:
+                break
+            last_id = batch[-1]
+
+            deleted_rows = await self._delete_media_rows(db, batch)
+            count += len(deleted_rows)
+
+            # File and cache cleanup only once the rows are gone for good
+            await asyncio.gather(*(delete_cover(row[0]) for row in deleted_rows))
+            for _, external_id, external_source in deleted_rows:
+                if external_id and external_source:
+                    await self._invalidate_api_cache(
+                        external_source, external_id=external_id
+                    )
+                    external_sources.add(external_source)
+
+        if not count:
             logger.info("No orphaned media items found")
+            return 0
 
+        for external_source in external_sources:
+            await self._invalidate_api_cache(external_source, search=True)
+
+        logger.info("Successfully cleaned up %d orphaned media items", count)
         return count
 
 
+# create_movie, update_movie, ... specialized once per media type on the class
+for _media_type, _model_class in MODEL_MAP.items():
+    setattr(
+        CRUDMedia,
+        f"create_{_media_type.value}",
+        partialmethod(
+            CRUDMedia._create_with_tags,
+            model_class=_model_class,
+            media_type=_media_type,
+        ),
+    )
+    setattr(
+        CRUDMedia,
+        f"update_{_media_type.value}",
+        partialmethod(CRUDMedia._update_by_id, media_type=_media_type),
+    )
+
 media_crud = CRUDMedia(Media)
@@ -1,36 +1,66 @@
 import re
+from functools import lru_cache
 from typing import List, Optional
 
-from sqlalchemy import delete, select
+from sqlalchemy import bindparam, delete, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from models import MediaTag, MediaTypeEnum, Tag
 
-from .base import CRUDBase, logger
+from .base import CRUDBase, conflict_insert, logger
 
 logger = logger.bind(module="tag")
 
+SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+SLUG_SEPARATOR_RE = re.compile(r"[-\s]+")
+
+# Key of the per-session map of lower(name) -> tag id in AsyncSession.info
+TAG_NAME_CACHE_KEY = "_tag_name_cache"
+
 
 class CRUDTag(CRUDBase[Tag]):
     """CRUD operations for tags"""
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _slugify(text: str) -> str:
-        """Convert text to slug"""
+        """Convert text to slug (memoized: imports repeat the same tag names)"""
         text = text.lower().strip()
-        text = re.sub(r"[^\w\s-]", "", text)
-        text = re.sub(r"[-\s]+", "-", text)
+        text = SLUG_STRIP_RE.sub("", text)
+        text = SLUG_SEPARATOR_RE.sub("-", text)
         return text
 
+    @staticmethod
+    def _name_cache(db: AsyncSession) -> dict:
+        """Tag ids by lowercased name, scoped to the session (one request)"""
+        return db.info.setdefault(TAG_NAME_CACHE_KEY, {})
+
     async def get_by_name(self, db: AsyncSession, *, name: str) -> Optional[Tag]:
         """Get tag by name (case-insensitive)"""
-        logger.debug(f"Getting tag by name: {name}")
-        result = await db.execute(select(Tag).filter(Tag.name.ilike(name)))
-        return result.scalar_one_or_none()
+        logger.debug("Getting tag by name: %s", name)
+        key = name.lower()
+        name_cache = self._name_cache(db)
+
+        # A tag resolved earlier in this session comes from the identity map;
+        # the name is re-checked in case it was deleted or renamed since
+        if key in name_cache:
+            tag = await db.get(Tag, name_cache[key])
+            if tag is not None and tag.name.lower() == key:
+                return tag
+            del name_cache[key]
+
+        # Equality on lower(name) is served by tags_lower_name_idx; an exact
+        # ILIKE cannot use a btree index
+        result = await db.execute(select(Tag).filter(func.lower(Tag.name) == key))
+        tag = result.scalars().first()
+        if tag is not None:
+            name_cache[key] = tag.id
+        return tag
 
     async def get_by_slug(self, db: AsyncSession, *, slug: str) -> Optional[Tag]:
         """Get tag by slug"""
-        logger.debug(f"Getting tag by slug: {slug}")
+        logger.debug("Getting tag by slug: %s", slug)
         result = await db.execute(select(Tag).filter(Tag.slug == slug))
         return result.scalar_one_or_none()
 
@@ -38,25 +68,17 @@ class CRUDTag(CRUDBase[Tag]):
         """Get existing tag or create new one"""
         name = name.strip()
 
-        existing_tag = await self.get_by_name(db, name=name)
-        if existing_tag:
-            logger.debug(f"Found existing tag: {existing_tag.name}")
-            return existing_tag
-
-        slug = self._slugify(name)
-        logger.info(f"Creating new tag: {name} (slug: {slug})")
-
-        tag = Tag(name=name, slug=slug)
-        db.add(tag)
+        # Lookup and insert run in one transaction, committed once; the
+        # INSERT ... RETURNING already filled the tag, so nothing is refreshed
+        (tag,) = await self._resolve_tags(db, [name])
         await db.commit()
-        await db.refresh(tag)
 
-        logger.debug(f"Created tag with id: {tag.id}")
+        logger.debug("Got tag with id: %s", tag.id)
         return tag
 
     async def get_tags_for_media(self, db: AsyncSession, *, media_id: int) -> List[Tag]:
         """Get all tags for a media item"""
-        logger.debug(f"Getting tags for media_id: {media_id}")
+        logger.debug("Getting tags for media_id: %s", media_id)
         result = await db.execute(
             select(Tag).join(MediaTag).filter(MediaTag.media_id == media_id)
         )
@@ -70,7 +92,7 @@ class CRUDTag(CRUDBase[Tag]):
         media_type: Optional[MediaTypeEnum] = None,
     ) -> List[int]:
         """Get all media IDs for a tag, optionally filtered by type"""
-        logger.debug(f"Getting media for tag_id: {tag_id}, type: {media_type}")
+        logger.debug("Getting media for tag_id: %s, type: %s", tag_id, media_type)
         stmt = select(MediaTag.media_id).filter(MediaTag.tag_id == tag_id)
 
         if media_type:
@@ -79,69 +101,202 @@ class CRUDTag(CRUDBase[Tag]):
         result = await db.execute(stmt)
         return [row[0] for row in result.all()]
 
-    async def add_tags_to_media(
+    async def link_tags(
         self,
         db: AsyncSession,
         *,
         media_id: int,
         media_type: MediaTypeEnum,
         tag_names: List[str],
-    ) -> List[Tag]:
-        """Add tags to media item, creating tags if needed"""
-        if not tag_names:
+    ) -> List[MediaTag]:
+        """
+        Associate tags with a media item without committing, creating tags if needed.
+        Returns the media's association for each tag, with the tag loaded.
+        """
+        # Deduplicated case-insensitively in first-seen order
+        stripped = (name.strip() for name in tag_names)
+        unique_names = list({name.lower(): name for name in stripped if name}.values())
+
+        if not unique_names:
             return []
 
-        logger.info(f"Adding {len(tag_names)} tags to media_id: {media_id}")
-
-        seen = set()
-        unique_names = []
-        for name in tag_names:
-            name = name.strip()
-            if name and name.lower() not in seen:
-                seen.add(name.lower())
-                unique_names.append(name)
+        # Names that slugify alike resolve to the same tag
+        resolved = await self._resolve_tags(db, unique_names)
+        tags = list({tag.id: tag for tag in resolved}.values())
 
-        tags = []
-        for tag_name in unique_names:
-            tag = await self.get_or_create(db, name=tag_name)
-            tags.append(tag)
+        # One multi-row INSERT; links that already exist are skipped by
+        # uq_media_tag instead of being looked up first
+        result = await db.execute(
+            conflict_insert(db, MediaTag)
+            .values(
+                [
+                    {"media_id": media_id, "tag_id": tag.id, "media_type": media_type}
+                    for tag in tags
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["media_id", "tag_id"])
+            .returning(MediaTag)
+        )
+        linked = {media_tag.tag_id: media_tag for media_tag in result.scalars().all()}
+        logger.debug("Associated %s tags with media_id: %s", len(linked), media_id)
 
+        if len(linked) < len(tags):
             result = await db.execute(
                 select(MediaTag).filter(
-                    MediaTag.media_id == media_id, MediaTag.tag_id == tag.id
+                    MediaTag.media_id == media_id,
+                    MediaTag.tag_id.in_([tag.id for tag in tags if tag.id not in linked]),
                 )
             )
-            existing = result.scalar_one_or_none()
+            linked.update(
+                (media_tag.tag_id, media_tag) for media_tag in result.scalars().all()
+            )
 
-            if not existing:
-                media_tag = MediaTag(
-                    media_id=media_id, tag_id=tag.id, media_type=media_type
+        associations = []
+        for tag in tags:
+            media_tag = linked[tag.id]
+            set_committed_value(media_tag, "tag", tag)
+            associations.append(media_tag)
+        return associations
+
+    async def _resolve_tags(self, db: AsyncSession, names: List[str]) -> List[Tag]:
+        """
+        Get or create tags for distinct names in two statements: one SELECT
+        (case-insensitive) and one multi-row INSERT for the missing ones.
+        """
+        result = await db.execute(
+            select(Tag).filter(func.lower(Tag.name).in_([n.lower() for n in names]))
+        )
+        tags_by_name = {tag.name.lower(): tag for tag in result.scalars().all()}
+
+        # Names that slugify alike share one tag
+        missing = {}
+        for name in names:
+            if name.lower() not in tags_by_name:
+                missing.setdefault(self._slugify(name), name)
+
+        if missing:
+            # Tags created concurrently, or sharing a slug with an existing
+            # tag, are skipped here and fetched below
+            result = await db.execute(
+                conflict_insert(db, Tag)
+                .values(
+                    [{"name": name, "slug": slug} for slug, name in missing.items()]
                 )
-                db.add(media_tag)
-                logger.debug(f"Associated tag '{tag.name}' with media_id: {media_id}")
+                .on_conflict_do_nothing()
+                .returning(Tag)
+            )
+            created = list(result.scalars().all())
+            for tag in created:
+                logger.info("Created new tag: %s (slug: %s)", tag.name, tag.slug)
+
+            skipped = missing.keys() - {tag.slug for tag in created}
+            if skipped:
+                result = await db.execute(
+                    select(Tag).filter(
+                        or_(
+                            Tag.slug.in_(skipped),
+                            func.lower(Tag.name).in_(
+                                [missing[slug].lower() for slug in skipped]
+                            ),
+                        )
+                    )
+                )
+                created.extend(result.scalars().all())
+
+            tags_by_slug = {tag.slug: tag for tag in created}
+            for tag in created:
+                tags_by_name.setdefault(tag.name.lower(), tag)
+            for name in names:
+                if name.lower() not in tags_by_name:
+                    tags_by_name[name.lower()] = tags_by_slug[self._slugify(name)]
+
+        self._name_cache(db).update(
+            (key, tag.id) for key, tag in tags_by_name.items()
+        )
+        return [tags_by_name[name.lower()] for name in names]
+
+    async def add_tags_to_media(
+        self,
+        db: AsyncSession,
+        *,
+        media_id: int,
+        media_type: MediaTypeEnum,
+        tag_names: List[str],
+    ) -> List[Tag]:
+        """Add tags to media item, creating tags if needed"""
+        if not tag_names:
+            return []
+
+        logger.info("Adding %s tags to media_id: %s", len(tag_names), media_id)
+
+        associations = await self.link_tags(
+            db, media_id=media_id, media_type=media_type, tag_names=tag_names
+        )
+        tags = [media_tag.tag for media_tag in associations]
 
         await db.commit()
-        logger.info(f"Successfully added {len(tags)} tags to media_id: {media_id}")
+        logger.info("Successfully added %s tags to media_id: %s", len(tags), media_id)
         return tags
 
     async def remove_tags_from_media(
-        self, db: AsyncSession, *, media_id: int, tag_ids: Optional[List[int]] = None
+        self,
+        db: AsyncSession,
+        *,
+        media_id: int,
+        tag_ids: Optional[List[int]] = None,
+        commit: bool = True,
     ):
         """Remove tags from media item. If tag_ids is None, remove all tags"""
-        logger.info(f"Removing tags from media_id: {media_id}")
+        logger.info("Removing tags from media_id: %s", media_id)
 
-        stmt = delete(MediaTag).filter(MediaTag.media_id == media_id)
+        stmt = delete(MediaTag).filter(MediaTag.media_id == bindparam("media_id"))
+        params = {"media_id": media_id}
 
         if tag_ids:
-            stmt = stmt.filter(MediaTag.tag_id.in_(tag_ids))
+            # One expanding parameter keeps the statement the same for any
+            # number of ids
+            stmt = stmt.filter(
+                MediaTag.tag_id.in_(bindparam("tag_ids", expanding=True))
+            )
+            params["tag_ids"] = tag_ids
 
-        result = await db.execute(stmt)
-        await db.commit()
+        result = await db.execute(stmt, params)
+        if commit:
+            await db.commit()
 
         logger.debug(
-            f"Removed {result.rowcount} tag associations from media_id: {media_id}"
+            "Removed %s tag associations from media_id: %s", result.rowcount, media_id
         )
 
+    async def sync_tags(
+        self,
+        db: AsyncSession,
+        *,
+        media_id: int,
+        media_type: MediaTypeEnum,
+        tag_names: List[str],
+    ) -> List[MediaTag]:
+        """
+        Make tag_names the media's complete tag set without committing.
+        Links that stay are left untouched; returns the new associations.
+        """
+        associations = await self.link_tags(
+            db, media_id=media_id, media_type=media_type, tag_names=tag_names
+        )
+
+        # One DELETE for the links that were dropped, instead of deleting
+        # every link and inserting the kept ones again
+        stmt = delete(MediaTag).filter(MediaTag.media_id == media_id)
+        if associations:
+            stmt = stmt.filter(
+                MediaTag.tag_id.not_in([media_tag.tag_id for media_tag in associations])
+            )
+        result = await db.execute(stmt)
+        logger.debug(
+            "Removed %s tag associations from media_id: %s", result.rowcount, media_id
+        )
+        return associations
+
     async def update_media_tags(
         self,
         db: AsyncSession,
@@ -151,13 +306,13 @@ class CRUDTag(CRUDBase[Tag]):
         tag_names: List[str],
     ) -> List[Tag]:
         """Update tags for media item (remove old, add new)"""
-        logger.info(f"Updating tags for media_id: {media_id}")
+        logger.info("Updating tags for media_id: %s", media_id)
 
-        await self.remove_tags_from_media(db, media_id=media_id)
-
-        return await self.add_tags_to_media(
+        associations = await self.sync_tags(
             db, media_id=media_id, media_type=media_type, tag_names=tag_names
         )
+        await db.commit()
+        return [media_tag.tag for media_tag in associations]
 
 
 tag_crud = CRUDTag(Tag)
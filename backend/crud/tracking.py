@@ -1,45 +1,105 @@
+from collections import Counter
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Type
 
 from pydantic import BaseModel
-from sqlalchemy import and_, case, desc, select
+from sqlalchemy import (and_, bindparam, case, delete, desc, func, inspect,
+                        select)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import contains_eager, joinedload
+from sqlalchemy.orm import contains_eager, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from core.cache import cache
 from core.exceptions import AlreadyExists
 from models import (
     Media,
     MediaTag,
     MediaTypeEnum,
+    Tag,
     Tracking,
     TrackingPriorityEnum,
     TrackingStatusEnum,
 )
 
-from .base import CRUDBase, logger
+from .base import (CRUDBase, conflict_insert, invalidate_statistics, logger,
+                   statistics_cache_key)
 from .media import media_crud
 
 logger = logger.bind(module="tracking")
 
+# Status and priority orderings are built once and shared by every listing
+STATUS_ORDER = case(
+    (Tracking.status == TrackingStatusEnum.IN_PROGRESS.value, 1),
+    (Tracking.status == TrackingStatusEnum.PLANNED.value, 2),
+    (Tracking.status == TrackingStatusEnum.ON_HOLD.value, 3),
+    (Tracking.status == TrackingStatusEnum.COMPLETED.value, 4),
+    (Tracking.status == TrackingStatusEnum.DROPPED.value, 5),
+    else_=6,
+)
+# Priority order that includes IN_PROGRESS at the top
+# This ensures IN_PROGRESS items stay at the top even when sorting by priority
+PRIORITY_ORDER = case(
+    (Tracking.status == TrackingStatusEnum.IN_PROGRESS.value, 1),
+    (Tracking.priority == TrackingPriorityEnum.HIGH.value, 2),
+    (Tracking.priority == TrackingPriorityEnum.MID.value, 3),
+    (Tracking.priority == TrackingPriorityEnum.LOW.value, 4),
+    (Tracking.status == TrackingStatusEnum.ON_HOLD.value, 5),
+    else_=6,
+)
+
+TRACKING_SORTS = {
+    # For priority sort, we want to respect the primary status order (In Progress first)
+    # but then group by priority within Planned, and keep other groups organized
+    "priority": (PRIORITY_ORDER.asc(), STATUS_ORDER.asc(), Tracking.id.desc()),
+    "rating": (desc(Tracking.rating), Tracking.id.desc()),
+    # Needs the media joined in
+    "title": (Media.title.asc(), Tracking.id.desc()),
+    # Using ID as proxy for creation date
+    "created_at": (Tracking.id.desc(),),
+}
+# Default sort: Status order, then Priority order, then ID
+DEFAULT_TRACKING_SORT = (STATUS_ORDER.asc(), PRIORITY_ORDER.asc(), Tracking.id.desc())
+
+# Statistics are cached per (user, media type) and dropped on every write to
+# the user's entries; the TTL bounds staleness from writes made elsewhere
+STATS_CACHE_TTL = 300
+
 
 class CRUDTracking(CRUDBase[Tracking]):
     """CRUD operations for tracking"""
 
-    async def get_by_user_and_media(
-        self, db: AsyncSession, *, user_id: int, media_id: int
-    ) -> Optional[Tracking]:
-        """Get tracking entry for user and media"""
-        logger.debug(f"Getting tracking for user_id: {user_id}, media_id: {media_id}")
-        stmt = (
+    def __init__(self, model: Type[Tracking]):
+        super().__init__(model)
+
+        # Looked up on every read, update and delete of an entry; built once
+        # and executed with bound parameters. A single entry joins its tags
+        # in: cheaper than the extra round-trip of selectinload
+        self._get_by_user_and_media_stmt = (
             select(Tracking)
             .options(
                 joinedload(Tracking.media)
                 .joinedload(Media.tag_associations)
                 .joinedload(MediaTag.tag)
             )
-            .filter(and_(Tracking.user_id == user_id, Tracking.media_id == media_id))
+            .filter(
+                and_(
+                    Tracking.user_id == bindparam("user_id"),
+                    Tracking.media_id == bindparam("media_id"),
+                )
+            )
+        )
+
+    async def get_by_user_and_media(
+        self, db: AsyncSession, *, user_id: int, media_id: int
+    ) -> Optional[Tracking]:
+        """Get tracking entry for user and media"""
+        logger.debug(
+            "Getting tracking for user_id: %s, media_id: %s", user_id, media_id
+        )
+        result = await db.execute(
+            self._get_by_user_and_media_stmt,
+            {"user_id": user_id, "media_id": media_id},
         )
-        result = await db.execute(stmt)
         return result.unique().scalar_one_or_none()
 
     async def get_by_user(
@@ -52,19 +112,36 @@ class CRUDTracking(CRUDBase[Tracking]):
         sort_by: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        after_id: Optional[int] = None,
     ) -> List[Tracking]:
-        """Get all tracking entries for a user, optionally filtered"""
+        """
+        Get all tracking entries for a user, optionally filtered.
+        - after_id: keyset cursor over the created_at order (newest first);
+          when given, skip and sort_by are ignored.
+        """
         logger.debug(
-            f"Getting tracking for user_id: {user_id} "
-            f"(status: {status}, media_type: {media_type}, sort_by: {sort_by}, skip: {skip}, limit: {limit})"
+            "Getting tracking for user_id: %s (status: %s, media_type: %s, "
+            "sort_by: %s, skip: %s, after_id: %s, limit: %s)",
+            user_id,
+            status,
+            media_type,
+            sort_by,
+            skip,
+            after_id,
+            limit,
         )
 
+        # The media is many-to-one and joins in without repeating rows; the
+        # tags load with SELECT ... IN, as joining them would repeat every
+        # tracking row once per tag
         stmt = (
             select(Tracking)
             .options(
                 joinedload(Tracking.media)
-                .joinedload(Media.tag_associations)
+                .selectinload(Media.tag_associations)
                 .joinedload(MediaTag.tag)
+                # Listings only render tag names
+                .load_only(Tag.id, Tag.name)
             )
             .filter(Tracking.user_id == user_id)
         )
@@ -75,48 +152,22 @@ class CRUDTracking(CRUDBase[Tracking]):
         if media_type:
             stmt = stmt.filter(Tracking.media_type == media_type)
 
-        # Define default status and priority sorting
-        status_order = case(
-            (Tracking.status == TrackingStatusEnum.IN_PROGRESS.value, 1),
-            (Tracking.status == TrackingStatusEnum.PLANNED.value, 2),
-            (Tracking.status == TrackingStatusEnum.ON_HOLD.value, 3),
-            (Tracking.status == TrackingStatusEnum.COMPLETED.value, 4),
-            (Tracking.status == TrackingStatusEnum.DROPPED.value, 5),
-            else_=6,
-        )
-        # Priority order that includes IN_PROGRESS at the top
-        # This ensures IN_PROGRESS items stay at the top even when sorting by priority
-        priority_order = case(
-            (Tracking.status == TrackingStatusEnum.IN_PROGRESS.value, 1),
-            (Tracking.priority == TrackingPriorityEnum.HIGH.value, 2),
-            (Tracking.priority == TrackingPriorityEnum.MID.value, 3),
-            (Tracking.priority == TrackingPriorityEnum.LOW.value, 4),
-            (Tracking.status == TrackingStatusEnum.ON_HOLD.value, 5),
-            else_=6,
-        )
-
-        # Apply sorting
-        if sort_by == "priority":
-            # For priority sort, we want to respect the primary status order (In Progress first)
-            # but then group by priority within Planned, and keep other groups organized
-            stmt = stmt.order_by(
-                priority_order.asc(), status_order.asc(), Tracking.id.desc()
+        # A cursor seeks into tracking_user_id_id_idx instead of scanning
+        # and discarding skip rows
+        if after_id is not None:
+            stmt = stmt.filter(Tracking.id < after_id).order_by(
+                *TRACKING_SORTS["created_at"]
             )
-        elif sort_by == "rating":
-            stmt = stmt.order_by(desc(Tracking.rating), Tracking.id.desc())
-        elif sort_by == "title":
-            stmt = stmt.join(Tracking.media).order_by(Media.title.asc(), Tracking.id.desc())
-        elif sort_by == "created_at":
-            # Using ID as proxy for creation date
-            stmt = stmt.order_by(Tracking.id.desc())
         else:
-            # Default sort: Status order, then Priority order, then ID
+            # Apply sorting
+            if sort_by == "title":
+                stmt = stmt.join(Tracking.media)
             stmt = stmt.order_by(
-                status_order.asc(), priority_order.asc(), Tracking.id.desc()
-            )
+                *TRACKING_SORTS.get(sort_by, DEFAULT_TRACKING_SORT)
+            ).offset(skip)
 
-        result = await db.execute(stmt.offset(skip).limit(limit))
-        return list(result.unique().scalars().all())
+        result = await db.execute(stmt.limit(limit))
+        return list(result.scalars().all())
 
     async def get_favorites(
         self,
@@ -126,18 +177,24 @@ class CRUDTracking(CRUDBase[Tracking]):
         media_type: Optional[MediaTypeEnum] = None,
         skip: int = 0,
         limit: int = 100,
+        after_id: Optional[int] = None,
     ) -> List[Tracking]:
-        """Get user's favorite media"""
+        """
+        Get user's favorite media, newest first.
+        - after_id: keyset cursor; when given, skip is ignored.
+        """
         logger.debug(
-            f"Getting favorites for user_id: {user_id} (media_type: {media_type})"
+            "Getting favorites for user_id: %s (media_type: %s)", user_id, media_type
         )
 
         stmt = (
             select(Tracking)
             .options(
                 joinedload(Tracking.media)
-                .joinedload(Media.tag_associations)
+                .selectinload(Media.tag_associations)
                 .joinedload(MediaTag.tag)
+                # Listings only render tag names
+                .load_only(Tag.id, Tag.name)
             )
             .filter(and_(Tracking.user_id == user_id, Tracking.favorite.is_(True)))
         )
@@ -145,8 +202,14 @@ class CRUDTracking(CRUDBase[Tracking]):
         if media_type:
             stmt = stmt.filter(Tracking.media_type == media_type)
 
-        result = await db.execute(stmt.offset(skip).limit(limit))
-        return list(result.unique().scalars().all())
+        stmt = stmt.order_by(*TRACKING_SORTS["created_at"])
+        if after_id is not None:
+            stmt = stmt.filter(Tracking.id < after_id)
+        else:
+            stmt = stmt.offset(skip)
+
+        result = await db.execute(stmt.limit(limit))
+        return list(result.scalars().all())
 
     async def _apply_data_integrity_rules(self, db_obj: Tracking) -> None:
         """
@@ -187,50 +250,56 @@ class CRUDTracking(CRUDBase[Tracking]):
         self, db: AsyncSession, *, obj_in: BaseModel, user_id: int
     ) -> Tracking:
         """Create tracking entry"""
-        logger.info(f"Creating tracking for user_id: {user_id}")
+        logger.info("Creating tracking for user_id: %s", user_id)
 
         obj_data = obj_in.model_dump(exclude_unset=True)
         obj_data["user_id"] = user_id
-
-        existing = await self.get_by_user_and_media(
-            db, user_id=user_id, media_id=obj_data["media_id"]
-        )
-
-        if existing:
-            logger.warning(
-                f"Tracking already exists for user_id: {user_id}, "
-                f"media_id: {obj_data['media_id']}"
-            )
-            raise AlreadyExists("Tracking entry", str(obj_data["media_id"]))
+        media_id = obj_data["media_id"]
 
         tracking = Tracking(**obj_data)
 
         # Apply data integrity rules before saving
         await self._apply_data_integrity_rules(tracking)
 
-        db.add(tracking)
-        await db.commit()
+        # uq_user_media rejects duplicates, so there is no lookup first: one
+        # atomic INSERT ... ON CONFLICT DO NOTHING RETURNING, and no row back
+        # means the entry already exists
+        values = {
+            key: value
+            for key, value in inspect(tracking).dict.items()
+            if key in Tracking.__table__.columns
+        }
+        result = await db.execute(
+            conflict_insert(db, Tracking)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=["user_id", "media_id"])
+            .returning(Tracking)
+        )
+        tracking = result.scalar_one_or_none()
 
-        stmt = (
-            select(Tracking)
-            .options(
-                joinedload(Tracking.media)
-                .joinedload(Media.tag_associations)
-                .joinedload(MediaTag.tag)
+        if tracking is None:
+            logger.warning(
+                "Tracking already exists for user_id: %s, media_id: %s",
+                user_id,
+                media_id,
             )
-            .filter(Tracking.id == tracking.id)
-        )
-        result = await db.execute(stmt)
-        tracking = result.unique().scalar_one()
+            raise AlreadyExists("Tracking entry", str(media_id))
+
+        # The inserted entry is already complete in the identity map; only its
+        # media graph is loaded for the response, without joining tracking
+        media = await media_crud.get_by_id(db, id=media_id)
+        set_committed_value(tracking, "media", media)
+        await db.commit()
+        await invalidate_statistics(user_id)
 
-        logger.debug(f"Created tracking with id: {tracking.id}")
+        logger.debug("Created tracking with id: %s", tracking.id)
         return tracking
 
     async def update(
         self, db: AsyncSession, *, tracking: Tracking, obj_in: BaseModel
     ) -> Tracking:
         """Update tracking entry"""
-        logger.info(f"Updating tracking with id: {tracking.id}")
+        logger.info("Updating tracking with id: %s", tracking.id)
 
         obj_data = obj_in.model_dump(exclude_unset=True)
 
@@ -240,53 +309,64 @@ class CRUDTracking(CRUDBase[Tracking]):
         # Apply data integrity rules after applying updates
         await self._apply_data_integrity_rules(tracking)
 
-        db.add(tracking)
+        # Entries come from get_by_user_and_media with their media graph and
+        # have no server-generated columns, so the response needs no reload;
+        # otherwise only the media graph is loaded, as in create
+        if "media" in inspect(tracking).unloaded:
+            media = await media_crud.get_by_id(db, id=tracking.media_id)
+            set_committed_value(tracking, "media", media)
         await db.commit()
+        await invalidate_statistics(tracking.user_id)
 
-        stmt = (
-            select(Tracking)
-            .options(
-                joinedload(Tracking.media)
-                .joinedload(Media.tag_associations)
-                .joinedload(MediaTag.tag)
-            )
-            .filter(Tracking.id == tracking.id)
-        )
-        result = await db.execute(stmt)
-        tracking = result.unique().scalar_one()
-
-        logger.debug(f"Updated tracking with id: {tracking.id}")
+        logger.debug("Updated tracking with id: %s", tracking.id)
         return tracking
 
     async def delete(self, db: AsyncSession, *, user_id: int, media_id: int) -> bool:
         """Delete tracking entry"""
-        logger.info(f"Deleting tracking for user_id: {user_id}, media_id: {media_id}")
+        logger.info(
+            "Deleting tracking for user_id: %s, media_id: %s", user_id, media_id
+        )
 
-        tracking = await self.get_by_user_and_media(
-            db, user_id=user_id, media_id=media_id
+        # A single DELETE ... RETURNING both removes the entry and reports
+        # whether its media is custom; nothing is loaded beforehand
+        media_table = Media.__table__
+        tracked_media = media_table.c.id == Tracking.media_id
+        result = await db.execute(
+            delete(Tracking)
+            .where(and_(Tracking.user_id == user_id, Tracking.media_id == media_id))
+            .returning(
+                Tracking.id,
+                select(media_table.c.is_custom)
+                .where(tracked_media)
+                .scalar_subquery()
+                .label("is_custom"),
+                select(media_table.c.created_by_id)
+                .where(tracked_media)
+                .scalar_subquery()
+                .label("created_by_id"),
+            )
         )
+        tracking = result.one_or_none()
 
         if not tracking:
             logger.warning(
-                f"Tracking not found for user_id: {user_id}, media_id: {media_id}"
+                "Tracking not found for user_id: %s, media_id: %s", user_id, media_id
             )
             return False
 
-        # Check if media is custom and record it for cleanup
-        is_custom = tracking.media.is_custom
-        media_owner_id = tracking.media.created_by_id
-
-        await db.delete(tracking)
-
-        if is_custom:
-            logger.info(f"Media {media_id} is custom, deleting it as well")
+        # Check if media is custom and clean it up as well
+        if tracking.is_custom:
+            logger.info("Media %s is custom, deleting it as well", media_id)
             await media_crud.delete(
-                db, id=media_id, user_id=media_owner_id, commit=False
+                db, id=media_id, user_id=tracking.created_by_id, commit=False
             )
 
         await db.commit()
+        await invalidate_statistics(user_id)
+        if tracking.is_custom and tracking.created_by_id != user_id:
+            await invalidate_statistics(tracking.created_by_id)
 
-        logger.debug(f"Deleted tracking with id: {tracking.id}")
+        logger.debug("Deleted tracking with id: %s", tracking.id)
         return True
 
     async def get_statistics(
@@ -298,53 +378,66 @@ class CRUDTracking(CRUDBase[Tracking]):
     ) -> dict:
         """Get user's tracking statistics"""
         logger.debug(
-            f"Getting statistics for user_id: {user_id} (media_type: {media_type})"
+            "Getting statistics for user_id: %s (media_type: %s)", user_id, media_type
         )
 
-        stmt = select(Tracking).filter(Tracking.user_id == user_id)
+        cache_key = statistics_cache_key(user_id, media_type)
+        cached_stats = await cache.get(cache_key)
+        if cached_stats:
+            return cached_stats
+
+        # Counted in the database: one small row per (status, media_type)
+        # instead of every tracking row hydrated as an ORM object
+        stmt = (
+            select(
+                Tracking.status,
+                Tracking.media_type,
+                func.count().label("entries"),
+                func.count().filter(Tracking.favorite.is_(True)).label("favorites"),
+                func.count(Tracking.rating).label("rated"),
+                func.sum(Tracking.rating).label("rating_sum"),
+            )
+            .filter(Tracking.user_id == user_id)
+            .group_by(Tracking.status, Tracking.media_type)
+        )
 
         if media_type:
             stmt = stmt.filter(Tracking.media_type == media_type)
 
         result = await db.execute(stmt)
-        all_entries = list(result.scalars().all())
+
+        # Every figure is accumulated in a single pass over the groups
+        by_status = Counter()
+        by_media_type = Counter()
+        favorites = rated = 0
+        rating_sum = 0.0
+        for group in result:
+            by_status[group.status] += group.entries
+            by_media_type[group.media_type] += group.entries
+            favorites += group.favorites
+            if group.rated:
+                rated += group.rated
+                rating_sum += group.rating_sum
 
         stats = {
-            "total": len(all_entries),
-            "completed": len(
-                [e for e in all_entries if e.status == TrackingStatusEnum.COMPLETED]
-            ),
-            "in_progress": len(
-                [e for e in all_entries if e.status == TrackingStatusEnum.IN_PROGRESS]
-            ),
-            "plan_to_watch": len(
-                [e for e in all_entries if e.status == TrackingStatusEnum.PLANNED]
-            ),
-            "dropped": len(
-                [e for e in all_entries if e.status == TrackingStatusEnum.DROPPED]
-            ),
-            "on_hold": len(
-                [e for e in all_entries if e.status == TrackingStatusEnum.ON_HOLD]
-            ),
-            "favorites": len([e for e in all_entries if e.favorite]),
+            "total": by_status.total(),
+            "completed": by_status[TrackingStatusEnum.COMPLETED],
+            "in_progress": by_status[TrackingStatusEnum.IN_PROGRESS],
+            "plan_to_watch": by_status[TrackingStatusEnum.PLANNED],
+            "dropped": by_status[TrackingStatusEnum.DROPPED],
+            "on_hold": by_status[TrackingStatusEnum.ON_HOLD],
+            "favorites": favorites,
+            "average_rating": rating_sum / rated if rated else 0,
         }
 
-        rated_entries = [e for e in all_entries if e.rating is not None]
-        stats["average_rating"] = (
-            sum(e.rating for e in rated_entries) / len(rated_entries)
-            if rated_entries
-            else 0
-        )
-
         if not media_type:
-            by_type = {}
-            for m_type in MediaTypeEnum:
-                by_type[m_type.value] = len(
-                    [e for e in all_entries if e.media_type == m_type]
-                )
-            stats["by_type"] = by_type
+            stats["by_type"] = {
+                m_type.value: by_media_type[m_type] for m_type in MediaTypeEnum
+            }
+
+        await cache.set(cache_key, stats, ttl=STATS_CACHE_TTL)
 
-        logger.debug(f"Statistics for user_id {user_id}: {stats}")
+        logger.debug("Statistics for user_id %s: %s", user_id, stats)
         return stats
 
 
@@ -1,49 +1,151 @@
-from typing import Optional
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Type
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached, raiseload
 
-from core.security import hash_password, verify_password
+from core.security import hash_password, verify_dummy_password, verify_password
 from models import User
 
 from .base import CRUDBase, logger
 
 logger = logger.bind(module="user")
 
+# Column values of recently authenticated users by username. Changes made
+# through this process evict the entry; USER_CACHE_TTL bounds how long a
+# change made by another worker goes unseen
+USER_CACHE_SIZE = 5000
+USER_CACHE_TTL = 30
+# What the routes read from the current user; the password hash is never
+# kept, and stays unloaded on a cached user
+CACHED_USER_COLUMNS = (
+    "id",
+    "username",
+    "email",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+
 
 class CRUDUser(CRUDBase[User]):
     """CRUD operations for users"""
 
+    def __init__(self, model: Type[User]):
+        super().__init__(model)
+
+        # The username lookup runs on every authenticated request; these are
+        # built once and executed with bound parameters, so their compiled
+        # form comes straight from the statement cache.
+        # Relationships are never loaded implicitly: a caller that needs
+        # tracking_entries or created_media must load them in its own query
+        no_lazy = raiseload("*")
+        self._get_by_username_stmt = (
+            select(User).options(no_lazy).filter(User.username == bindparam("username"))
+        )
+        self._get_by_email_stmt = (
+            select(User).options(no_lazy).filter(User.email == bindparam("email"))
+        )
+        username = bindparam("username")
+        self._get_by_username_or_email_stmt = (
+            select(User)
+            .options(no_lazy)
+            .filter(or_(User.username == username, User.email == bindparam("email")))
+            .order_by((User.username == username).desc())
+            .limit(1)
+        )
+        self._user_cache: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        # Cached username by user id, so eviction needs no scan
+        self._cached_usernames: dict[int, str] = {}
+
     async def get_by_email(self, db: AsyncSession, *, email: str) -> Optional[User]:
         """Get user by email"""
-        logger.debug(f"Getting user by email: {email}")
-        result = await db.execute(select(User).filter(User.email == email))
+        logger.debug("Getting user by email: %s", email)
+        result = await db.execute(self._get_by_email_stmt, {"email": email})
         return result.scalar_one_or_none()
 
     async def get_by_username(
         self, db: AsyncSession, *, username: str
     ) -> Optional[User]:
         """Get user by username"""
-        logger.debug(f"Getting user by username: {username}")
-        result = await db.execute(select(User).filter(User.username == username))
+        logger.debug("Getting user by username: %s", username)
+        result = await db.execute(self._get_by_username_stmt, {"username": username})
+        return result.scalar_one_or_none()
+
+    async def get_by_username_cached(
+        self, db: AsyncSession, *, username: str
+    ) -> Optional[User]:
+        """
+        get_by_username for the per-request auth check. A user loaded in the
+        last USER_CACHE_TTL seconds is attached to the session without a query.
+        """
+        now = time.monotonic()
+        cached = self._user_cache.get(username)
+        if cached is not None:
+            values, expires_at = cached
+            if now < expires_at:
+                self._user_cache.move_to_end(username)
+                user = User(**values)
+                make_transient_to_detached(user)
+                return await db.merge(user, load=False)
+            self._drop_cached(username)
+
+        user = await self.get_by_username(db, username=username)
+        if user is not None:
+            # Plain values rather than the instance, which belongs to this
+            # request's session and may still be modified by it
+            values = {key: getattr(user, key) for key in CACHED_USER_COLUMNS}
+            self._evict_cached(user.id)
+            self._user_cache[username] = (values, now + USER_CACHE_TTL)
+            self._cached_usernames[user.id] = username
+            if len(self._user_cache) > USER_CACHE_SIZE:
+                _, (oldest, _) = self._user_cache.popitem(last=False)
+                del self._cached_usernames[oldest["id"]]
+        return user
+
+    def _drop_cached(self, username: str):
+        """Drop the cached entry under username"""
+        values, _ = self._user_cache.pop(username)
+        del self._cached_usernames[values["id"]]
+
+    def _evict_cached(self, user_id: int):
+        """Drop a user's cached entry, whatever username it is under"""
+        username = self._cached_usernames.get(user_id)
+        if username is not None:
+            self._drop_cached(username)
+
+    async def get_by_username_or_email(
+        self, db: AsyncSession, *, username: str, email: str
+    ) -> Optional[User]:
+        """Get the user matching username or email in one query, username first"""
+        logger.debug("Getting user by username: %s or email: %s", username, email)
+        result = await db.execute(
+            self._get_by_username_or_email_stmt,
+            {"username": username, "email": email},
+        )
         return result.scalar_one_or_none()
 
     async def create(
         self, db: AsyncSession, *, username: str, email: str, password: str
     ) -> User:
         """Create new user with hashed password"""
-        logger.info(f"Creating user: {username}")
+        logger.info("Creating user: %s", username)
 
-        hashed_password = hash_password(password)
+        # Hashed off the event loop, like the check in authenticate
+        hashed_password = await asyncio.to_thread(hash_password, password)
 
         user = User(username=username, email=email, hashed_password=hashed_password)
 
         db.add(user)
         await db.flush()
-        await db.commit()
+        # Refreshed inside the transaction, before it commits
         await db.refresh(user)
+        await db.commit()
 
-        logger.debug(f"Created user with id: {user.id}")
+        logger.debug("Created user with id: %s", user.id)
         return user
 
     async def update(
@@ -56,44 +158,57 @@ class CRUDUser(CRUDBase[User]):
         password: Optional[str] = None,
     ) -> User:
         """Update user information"""
-        logger.info(f"Updating user with id: {user.id}")
+        logger.info("Updating user with id: %s", user.id)
+        self._evict_cached(user.id)
 
         if username:
             user.username = username
         if email:
             user.email = email
         if password:
-            user.hashed_password = hash_password(password)
+            user.hashed_password = await asyncio.to_thread(hash_password, password)
 
         db.add(user)
         await db.flush()
-        await db.commit()
+        # Refreshed inside the transaction, before it commits
         await db.refresh(user)
+        await db.commit()
 
-        logger.debug(f"Updated user with id: {user.id}")
+        logger.debug("Updated user with id: %s", user.id)
         return user
 
+    async def delete(self, db: AsyncSession, *, id: Any) -> bool:
+        """Delete user"""
+        self._evict_cached(id)
+        return await super().delete(db, id=id)
+
     async def authenticate(
         self, db: AsyncSession, *, username: str, password: str
     ) -> Optional[User]:
         """Authenticate user by username/email and password"""
-        logger.debug(f"Authenticating user: {username}")
+        logger.debug("Authenticating user: %s", username)
 
-        # Try to find by username
-        user = await self.get_by_username(db, username=username)
-        if not user:
-            # Try to find by email
-            user = await self.get_by_email(db, email=username)
+        # The identifier may be either; a username match wins over an email
+        user = await self.get_by_username_or_email(
+            db, username=username, email=username
+        )
 
         if not user:
-            logger.warning(f"User not found with identifier: {username}")
+            # Costs the same bcrypt check as a wrong password, so response
+            # time does not tell whether the account exists
+            await asyncio.to_thread(verify_dummy_password, password)
+            logger.warning("User not found with identifier: %s", username)
             return None
 
-        if not verify_password(password, user.hashed_password):
-            logger.warning(f"Invalid password for user: {user.username}")
+        # bcrypt is deliberately slow; checking off the event loop keeps other
+        # requests moving while it runs
+        if not await asyncio.to_thread(
+            verify_password, password, user.hashed_password
+        ):
+            logger.warning("Invalid password for user: %s", user.username)
             return None
 
-        logger.info(f"User authenticated successfully: {user.username}")
+        logger.info("User authenticated successfully: %s", user.username)
         return user
 
     def is_active(self, user: User) -> bool:
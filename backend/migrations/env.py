@@ -33,6 +33,17 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# PostgreSQL-only objects created by hand-written migrations and deliberately
+# left out of the ORM metadata; keep autogenerate from proposing to drop them
+UNMAPPED_OBJECTS = {"search_vec", "media_search_vec_idx"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip reflected objects that only exist in migrations."""
+    if reflected and compare_to is None and name in UNMAPPED_OBJECTS:
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -55,6 +66,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -77,7 +89,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
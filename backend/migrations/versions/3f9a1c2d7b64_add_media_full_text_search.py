@@ -0,0 +1,39 @@
+"""add media full-text search vector
+
+Revision ID: 3f9a1c2d7b64
+Revises: c23b8626b555
+Create Date: 2026-10-16 09:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2d7b64'
+down_revision: Union[str, Sequence[str], None] = 'c23b8626b555'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # tsvector / GIN are PostgreSQL-only; other backends keep the ILIKE search
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        "ALTER TABLE media ADD COLUMN search_vec tsvector GENERATED ALWAYS AS ("
+        "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+        ") STORED"
+    )
+    op.create_index('media_search_vec_idx', 'media', ['search_vec'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('media_search_vec_idx', table_name='media', postgresql_using='gin')
+    op.drop_column('media', 'search_vec')
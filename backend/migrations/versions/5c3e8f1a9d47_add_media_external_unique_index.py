@@ -0,0 +1,35 @@
+"""add media external id unique index
+
+Revision ID: 5c3e8f1a9d47
+Revises: a4d7e9b3c215
+Create Date: 2026-10-16 11:42:18.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c3e8f1a9d47'
+down_revision: Union[str, Sequence[str], None] = 'a4d7e9b3c215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'media_external_uidx',
+        'media',
+        ['external_source', 'external_id', 'media_type'],
+        unique=True,
+        postgresql_where=sa.text('external_id IS NOT NULL'),
+        sqlite_where=sa.text('external_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('media_external_uidx', table_name='media')
@@ -0,0 +1,48 @@
+"""weight media search vector
+
+Revision ID: 7e2d4b9c1a36
+Revises: 5c3e8f1a9d47
+Create Date: 2026-10-16 18:21:05.318274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e2d4b9c1a36'
+down_revision: Union[str, Sequence[str], None] = '5c3e8f1a9d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recreate_search_vec(expression: str) -> None:
+    # A generated column's expression cannot be altered in place
+    op.drop_index('media_search_vec_idx', table_name='media', postgresql_using='gin')
+    op.drop_column('media', 'search_vec')
+    op.execute(
+        f"ALTER TABLE media ADD COLUMN search_vec tsvector GENERATED ALWAYS AS ({expression}) STORED"
+    )
+    op.create_index('media_search_vec_idx', 'media', ['search_vec'], unique=False, postgresql_using='gin')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # Title lexemes weigh more than description ones in ts_rank
+    _recreate_search_vec(
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _recreate_search_vec(
+        "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+    )
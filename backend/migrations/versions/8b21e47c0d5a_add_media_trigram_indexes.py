@@ -0,0 +1,36 @@
+"""add media trigram indexes
+
+Revision ID: 8b21e47c0d5a
+Revises: 3f9a1c2d7b64
+Create Date: 2026-10-16 09:40:05.718263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b21e47c0d5a'
+down_revision: Union[str, Sequence[str], None] = '3f9a1c2d7b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('media_title_trgm', 'media', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('media_desc_trgm', 'media', ['description'], unique=False, postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+    op.execute("ANALYZE media")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('media_desc_trgm', table_name='media', postgresql_using='gin')
+    op.drop_index('media_title_trgm', table_name='media', postgresql_using='gin')
@@ -0,0 +1,33 @@
+"""add tags lower(name) index
+
+Revision ID: 9a4f6c2e8b17
+Revises: 7e2d4b9c1a36
+Create Date: 2026-10-16 18:47:12.905361
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4f6c2e8b17'
+down_revision: Union[str, Sequence[str], None] = '7e2d4b9c1a36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'tags_lower_name_idx',
+        'tags',
+        [sa.text('lower(name)')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('tags_lower_name_idx', table_name='tags')
@@ -0,0 +1,35 @@
+"""add custom media lower(title) index
+
+Revision ID: a4d7e9b3c215
+Revises: 8b21e47c0d5a
+Create Date: 2026-10-16 10:05:47.220931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d7e9b3c215'
+down_revision: Union[str, Sequence[str], None] = '8b21e47c0d5a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'media_lower_title_user_idx',
+        'media',
+        ['created_by_id', 'media_type', sa.text('lower(title)')],
+        unique=False,
+        postgresql_where=sa.text('is_custom = true'),
+        sqlite_where=sa.text('is_custom = 1'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('media_lower_title_user_idx', table_name='media')
@@ -0,0 +1,31 @@
+"""drop indexes covered by uq_media_tag and uq_user_media
+
+Revision ID: b6e3a8d2f591
+Revises: 9a4f6c2e8b17
+Create Date: 2026-10-16 19:32:40.118274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e3a8d2f591'
+down_revision: Union[str, Sequence[str], None] = '9a4f6c2e8b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # uq_media_tag (media_id, tag_id) and uq_user_media (user_id, media_id)
+    # lead with these columns and serve the same lookups
+    op.drop_index(op.f('ix_media_tags_media_id'), table_name='media_tags')
+    op.drop_index(op.f('ix_tracking_user_id'), table_name='tracking')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_tracking_user_id'), 'tracking', ['user_id'], unique=False)
+    op.create_index(op.f('ix_media_tags_media_id'), 'media_tags', ['media_id'], unique=False)
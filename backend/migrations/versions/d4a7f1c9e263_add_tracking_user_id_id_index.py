@@ -0,0 +1,29 @@
+"""add tracking (user_id, id) index
+
+Revision ID: d4a7f1c9e263
+Revises: b6e3a8d2f591
+Create Date: 2026-10-16 20:05:18.402317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7f1c9e263'
+down_revision: Union[str, Sequence[str], None] = 'b6e3a8d2f591'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'tracking_user_id_id_idx', 'tracking', ['user_id', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('tracking_user_id_id_idx', table_name='tracking')
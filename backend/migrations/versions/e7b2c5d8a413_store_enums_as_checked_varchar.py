@@ -0,0 +1,71 @@
+"""store enum columns as varchar with check constraints
+
+Revision ID: e7b2c5d8a413
+Revises: d4a7f1c9e263
+Create Date: 2026-10-16 21:14:52.730194
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2c5d8a413'
+down_revision: Union[str, Sequence[str], None] = 'd4a7f1c9e263'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MEDIA_TYPES = ('MOVIE', 'SERIES', 'ANIME', 'MANGA', 'BOOK', 'GAME')
+
+# (table, column, native type, constraint, members)
+COLUMNS = [
+    ('media', 'media_type', 'mediatypeenum', 'check_media_type', MEDIA_TYPES),
+    ('media_tags', 'media_type', 'mediatypeenum', 'check_media_type', MEDIA_TYPES),
+    ('tracking', 'media_type', 'mediatypeenum', 'check_media_type', MEDIA_TYPES),
+    (
+        'tracking',
+        'status',
+        'trackingstatusenum',
+        'check_status',
+        ('PLANNED', 'IN_PROGRESS', 'COMPLETED', 'DROPPED', 'ON_HOLD'),
+    ),
+    ('tracking', 'priority', 'trackingpriorityenum', 'check_priority', ('LOW', 'MID', 'HIGH')),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Native ENUM types only exist on PostgreSQL; elsewhere these columns are
+    # already plain VARCHAR
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column, _, constraint, members in COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(16) "
+            f"USING {column}::text"
+        )
+        op.create_check_constraint(
+            constraint, table, f"{column} IN ({', '.join(repr(m) for m in members)})"
+        )
+    for type_name in ('mediatypeenum', 'trackingstatusenum', 'trackingpriorityenum'):
+        op.execute(f"DROP TYPE {type_name}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    created = set()
+    for table, column, type_name, constraint, members in COLUMNS:
+        if type_name not in created:
+            op.execute(
+                f"CREATE TYPE {type_name} AS ENUM "
+                f"({', '.join(repr(m) for m in members)})"
+            )
+            created.add(type_name)
+        op.drop_constraint(constraint, table, type_='check')
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} "
+            f"USING {column}::{type_name}"
+        )
@@ -1,6 +1,9 @@
-from sqlalchemy import JSON, Column
+from typing import Optional
+
+from sqlalchemy import JSON
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
 
 from .media import AgeRatingEnum, Media, MediaStatusEnum, MediaTypeEnum
 
@@ -8,16 +11,23 @@ from .media import AgeRatingEnum, Media, MediaStatusEnum, MediaTypeEnum
 class Anime(Media):
     __tablename__ = "anime"
 
-    id = Column(Integer, ForeignKey("media.id"), primary_key=True)
-    original_title = Column(String(255), nullable=True)
-    age_rating = Column(SQLEnum(AgeRatingEnum), nullable=True)
-    seasons = Column(Integer, nullable=True)
-    total_episodes = Column(Integer, nullable=True)
-    studios = Column(JSON, nullable=True)  # List of studio names
-    status = Column(SQLEnum(MediaStatusEnum), nullable=True)
+    id: Mapped[int] = mapped_column(ForeignKey("media.id"), primary_key=True)
+    original_title: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    age_rating: Mapped[Optional[AgeRatingEnum]] = mapped_column(
+        SQLEnum(AgeRatingEnum), nullable=True
+    )
+    seasons: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    total_episodes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    studios: Mapped[Optional[list]] = mapped_column(
+        JSON, nullable=True
+    )  # List of studio names
+    status: Mapped[Optional[MediaStatusEnum]] = mapped_column(
+        SQLEnum(MediaStatusEnum), nullable=True
+    )
 
     __mapper_args__ = {
         "polymorphic_identity": MediaTypeEnum.ANIME,
+        "polymorphic_load": "selectin",
     }
 
     def __repr__(self):
@@ -1,4 +1,7 @@
-from sqlalchemy import JSON, Column, ForeignKey, Integer, String
+from typing import Optional
+
+from sqlalchemy import JSON, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
 
 from .media import Media, MediaTypeEnum
 
@@ -6,13 +9,14 @@ from .media import Media, MediaTypeEnum
 class Book(Media):
     __tablename__ = "books"
 
-    id = Column(Integer, ForeignKey("media.id"), primary_key=True)
-    pages = Column(Integer, nullable=True)
-    authors = Column(JSON, nullable=True)
-    isbn = Column(String(20), nullable=True)
+    id: Mapped[int] = mapped_column(ForeignKey("media.id"), primary_key=True)
+    pages: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    authors: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    isbn: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
     __mapper_args__ = {
         "polymorphic_identity": MediaTypeEnum.BOOK,
+        "polymorphic_load": "selectin",
     }
 
     def __repr__(self):
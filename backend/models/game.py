@@ -1,6 +1,8 @@
 from enum import Enum
+from typing import Optional
 
-from sqlalchemy import JSON, Column, ForeignKey, Integer
+from sqlalchemy import JSON, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
 
 from .media import Media, MediaTypeEnum
 
@@ -20,13 +22,16 @@ class PlatformEnum(str, Enum):
 class Game(Media):
     __tablename__ = "games"
 
-    id = Column(Integer, ForeignKey("media.id"), primary_key=True)
-    platforms = Column(JSON, nullable=True)  # List of PlatformEnum values
-    developers = Column(JSON, nullable=True)
-    publishers = Column(JSON, nullable=True)
+    id: Mapped[int] = mapped_column(ForeignKey("media.id"), primary_key=True)
+    platforms: Mapped[Optional[list]] = mapped_column(
+        JSON, nullable=True
+    )  # List of PlatformEnum values
+    developers: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    publishers: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
 
     __mapper_args__ = {
         "polymorphic_identity": MediaTypeEnum.GAME,
+        "polymorphic_load": "selectin",
     }
 
     def __repr__(self):
@@ -1,11 +1,16 @@
+from datetime import date
 from enum import Enum
+from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Boolean, Column, Date
-from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Date, ForeignKey, Index, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from core.database import Base
+from core.database import Base, string_enum
+
+if TYPE_CHECKING:
+    from .tag import MediaTag
+    from .tracking import Tracking
+    from .user import User
 
 
 class MediaTypeEnum(str, Enum):
@@ -38,33 +43,78 @@ class AgeRatingEnum(str, Enum):
 class Media(Base):
     __tablename__ = "media"
 
-    id = Column(Integer, primary_key=True, index=True)
-    media_type = Column(SQLEnum(MediaTypeEnum), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    media_type: Mapped[MediaTypeEnum] = mapped_column(
+        string_enum(MediaTypeEnum, "check_media_type"), nullable=False, index=True
+    )
 
-    title = Column(String(255), nullable=False, index=True)
-    description = Column(Text, nullable=True)
-    release_date = Column(Date, nullable=True)
-    cover_image_url = Column(String(512), nullable=True)
+    title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    release_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    cover_image_url: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
 
-    external_id = Column(String(100), nullable=True, index=True)
-    external_source = Column(String(50), nullable=True)
+    external_id: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True, index=True
+    )
+    external_source: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
-    is_custom = Column(Boolean, default=False)
+    is_custom: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
 
-    created_by_id = Column(
-        Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True
+    created_by_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True
     )
 
+    __table_args__ = (
+        # Trigram indexes let the ILIKE '%q%' search fallback use an index scan
+        Index(
+            "media_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "media_desc_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    # No with_polymorphic: queries on Media read only this table, and each
+    # subclass loads its own columns with SELECT ... IN (polymorphic_load)
     __mapper_args__ = {
         "polymorphic_identity": "media",
-        "polymorphic_on": media_type,
-        "with_polymorphic": "*",
+        "polymorphic_on": "media_type",
     }
 
-    created_by = relationship("User", back_populates="created_media")
-    tracking_entries = relationship(
-        "Tracking", back_populates="media", cascade="all, delete-orphan"
+    created_by: Mapped[Optional["User"]] = relationship(back_populates="created_media")
+    # passive_deletes: the FKs cascade in the database, so deleting a media
+    # does not load these collections to delete them row by row
+    tracking_entries: Mapped[List["Tracking"]] = relationship(
+        back_populates="media", cascade="all, delete-orphan", passive_deletes=True
     )
-    tag_associations = relationship(
-        "MediaTag", back_populates="media", cascade="all, delete-orphan"
+    tag_associations: Mapped[List["MediaTag"]] = relationship(
+        back_populates="media", cascade="all, delete-orphan", passive_deletes=True
     )
+
+
+# Backs the case-insensitive duplicate check for custom media
+Index(
+    "media_lower_title_user_idx",
+    Media.created_by_id,
+    Media.media_type,
+    func.lower(Media.title),
+    postgresql_where=Media.is_custom == True,
+    sqlite_where=Media.is_custom == True,
+)
+
+# One row per external item; lets concurrent creates fail fast on insert
+Index(
+    "media_external_uidx",
+    Media.external_source,
+    Media.external_id,
+    Media.media_type,
+    unique=True,
+    postgresql_where=Media.external_id.isnot(None),
+    sqlite_where=Media.external_id.isnot(None),
+)
@@ -1,4 +1,7 @@
-from sqlalchemy import JSON, Column, ForeignKey, Integer
+from typing import Optional
+
+from sqlalchemy import JSON, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
 
 from .media import Media, MediaTypeEnum
 
@@ -6,12 +9,13 @@ from .media import Media, MediaTypeEnum
 class Movie(Media):
     __tablename__ = "movies"
 
-    id = Column(Integer, ForeignKey("media.id"), primary_key=True)
-    runtime = Column(Integer, nullable=True)  # in minutes
-    directors = Column(JSON, nullable=True)
+    id: Mapped[int] = mapped_column(ForeignKey("media.id"), primary_key=True)
+    runtime: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # in minutes
+    directors: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
 
     __mapper_args__ = {
         "polymorphic_identity": MediaTypeEnum.MOVIE,
+        "polymorphic_load": "selectin",
     }
 
     def __repr__(self):
@@ -1,6 +1,9 @@
-from sqlalchemy import JSON, Column
+from typing import Optional
+
+from sqlalchemy import JSON
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
 
 from .media import Media, MediaStatusEnum, MediaTypeEnum
 
@@ -8,14 +11,17 @@ from .media import Media, MediaStatusEnum, MediaTypeEnum
 class Series(Media):
     __tablename__ = "series"
 
-    id = Column(Integer, ForeignKey("media.id"), primary_key=True)
-    total_episodes = Column(Integer, nullable=True)
-    seasons = Column(Integer, nullable=True)
-    status = Column(SQLEnum(MediaStatusEnum), nullable=True)
-    directors = Column(JSON, nullable=True)
+    id: Mapped[int] = mapped_column(ForeignKey("media.id"), primary_key=True)
+    total_episodes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    seasons: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    status: Mapped[Optional[MediaStatusEnum]] = mapped_column(
+        SQLEnum(MediaStatusEnum), nullable=True
+    )
+    directors: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
 
     __mapper_args__ = {
         "polymorphic_identity": MediaTypeEnum.SERIES,
+        "polymorphic_load": "selectin",
     }
 
     def __repr__(self):
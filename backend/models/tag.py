@@ -1,46 +1,60 @@
-from sqlalchemy import Column
-from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
-from sqlalchemy.orm import relationship
+from typing import TYPE_CHECKING, List
 
-from core.database import Base
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from core.database import Base, string_enum
 
 from .media import MediaTypeEnum
 
+if TYPE_CHECKING:
+    from .media import Media
+
 
 class Tag(Base):
     __tablename__ = "tags"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False, unique=True, index=True)
-    slug = Column(String(100), nullable=False, unique=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(
+        String(100), nullable=False, unique=True, index=True
+    )
+    slug: Mapped[str] = mapped_column(
+        String(100), nullable=False, unique=True, index=True
+    )
 
-    media_associations = relationship(
-        "MediaTag", back_populates="tag", cascade="all, delete-orphan"
+    media_associations: Mapped[List["MediaTag"]] = relationship(
+        back_populates="tag", cascade="all, delete-orphan", passive_deletes=True
     )
 
     def __repr__(self):
         return f"<Tag(id={self.id}, name={self.name})>"
 
 
+# Backs the case-insensitive tag name lookups
+Index("tags_lower_name_idx", func.lower(Tag.name))
+
+
 class MediaTag(Base):
     """Association table between Media and Tags"""
 
     __tablename__ = "media_tags"
 
-    id = Column(Integer, primary_key=True, index=True)
-    media_id = Column(
-        Integer, ForeignKey("media.id", ondelete="CASCADE"), nullable=False, index=True
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    # Indexed as the leading column of uq_media_tag
+    media_id: Mapped[int] = mapped_column(
+        ForeignKey("media.id", ondelete="CASCADE"), nullable=False
+    )
+    tag_id: Mapped[int] = mapped_column(
+        ForeignKey("tags.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    tag_id = Column(
-        Integer, ForeignKey("tags.id", ondelete="CASCADE"), nullable=False, index=True
+    media_type: Mapped[MediaTypeEnum] = mapped_column(
+        string_enum(MediaTypeEnum, "check_media_type"), nullable=False, index=True
     )
-    media_type = Column(SQLEnum(MediaTypeEnum), nullable=False, index=True)
 
     __table_args__ = (UniqueConstraint("media_id", "tag_id", name="uq_media_tag"),)
 
-    media = relationship("Media", back_populates="tag_associations")
-    tag = relationship("Tag", back_populates="media_associations")
+    media: Mapped["Media"] = relationship(back_populates="tag_associations")
+    tag: Mapped["Tag"] = relationship(back_populates="media_associations")
 
     def __repr__(self):
         return (
@@ -1,23 +1,28 @@
+from datetime import date
 from enum import Enum
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
-    Column,
     Date,
-    Enum as SQLEnum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     Text,
     UniqueConstraint,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from core.database import Base
+from core.database import Base, string_enum
 
 from .media import MediaTypeEnum
 
+if TYPE_CHECKING:
+    from .media import Media
+    from .user import User
+
 
 class TrackingStatusEnum(str, Enum):
     PLANNED = "planned"
@@ -36,33 +41,42 @@ class TrackingPriorityEnum(str, Enum):
 class Tracking(Base):
     __tablename__ = "tracking"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    # Indexed as the leading column of uq_user_media
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    media_id: Mapped[int] = mapped_column(
+        ForeignKey("media.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    media_id = Column(
-        Integer, ForeignKey("media.id", ondelete="CASCADE"), nullable=False, index=True
+    media_type: Mapped[MediaTypeEnum] = mapped_column(
+        string_enum(MediaTypeEnum, "check_media_type"), nullable=False, index=True
     )
-    media_type = Column(SQLEnum(MediaTypeEnum), nullable=False, index=True)
 
-    status = Column(SQLEnum(TrackingStatusEnum), nullable=False)
-    priority = Column(SQLEnum(TrackingPriorityEnum), nullable=True)
-    rating = Column(Float, nullable=True)
-    progress = Column(Integer, default=0)
+    status: Mapped[TrackingStatusEnum] = mapped_column(
+        string_enum(TrackingStatusEnum, "check_status"), nullable=False
+    )
+    priority: Mapped[Optional[TrackingPriorityEnum]] = mapped_column(
+        string_enum(TrackingPriorityEnum, "check_priority"), nullable=True
+    )
+    rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    progress: Mapped[Optional[int]] = mapped_column(Integer, default=0)
 
-    start_date = Column(Date, nullable=True)
-    end_date = Column(Date, nullable=True)
+    start_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    end_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
 
-    favorite = Column(Boolean, default=False)
-    notes = Column(Text, nullable=True)
+    favorite: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     __table_args__ = (
         UniqueConstraint("user_id", "media_id", name="uq_user_media"),
         CheckConstraint("rating >= 1 AND rating <= 10", name="check_rating_range"),
+        # Serves a user's entries newest first and the keyset cursor on id
+        Index("tracking_user_id_id_idx", "user_id", "id"),
     )
 
-    user = relationship("User", back_populates="tracking_entries")
-    media = relationship("Media", back_populates="tracking_entries")
+    user: Mapped["User"] = relationship(back_populates="tracking_entries")
+    media: Mapped["Media"] = relationship(back_populates="tracking_entries")
 
     def __repr__(self):
         return f"<Tracking(id={self.id}, user_id={self.user_id}, media_id={self.media_id}, status={self.status})>"
@@ -1,31 +1,42 @@
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.database import Base
 
+if TYPE_CHECKING:
+    from .media import Media
+    from .tracking import Tracking
+
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
-    username = Column(String(50), unique=True, nullable=False, index=True)
-    email = Column(String(100), unique=True, nullable=False, index=True)
-    hashed_password = Column(String(255), nullable=False)
-    is_active = Column(Boolean, nullable=False, default=True)
-    created_at = Column(DateTime, default=datetime.now(timezone.utc), nullable=False)
-    updated_at = Column(
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    username: Mapped[str] = mapped_column(
+        String(50), unique=True, nullable=False, index=True
+    )
+    email: Mapped[str] = mapped_column(
+        String(100), unique=True, nullable=False, index=True
+    )
+    hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now(timezone.utc), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
         DateTime,
         default=datetime.now(timezone.utc),
         onupdate=datetime.now(timezone.utc),
         nullable=False,
     )
 
-    tracking_entries = relationship(
-        "Tracking", back_populates="user", cascade="all, delete-orphan"
+    tracking_entries: Mapped[List["Tracking"]] = relationship(
+        back_populates="user", cascade="all, delete-orphan", passive_deletes=True
     )
-    created_media = relationship("Media", back_populates="created_by")
+    created_media: Mapped[List["Media"]] = relationship(back_populates="created_by")
 
     def __repr__(self):
         return f"<User(id={self.id}, username={self.username})>"
@@ -34,11 +34,14 @@ async def register(
     """Register a new user and set auth cookie"""
     logger.info(f"Registration attempt for username: {user_data.username}")
 
-    if await user_crud.get_by_username(db, username=user_data.username):
+    existing = await user_crud.get_by_username_or_email(
+        db, username=user_data.username, email=user_data.email
+    )
+    if existing and existing.username == user_data.username:
         logger.warning(f"Username already exists: {user_data.username}")
         raise AlreadyExists("Username", user_data.username)
 
-    if await user_crud.get_by_email(db, email=user_data.email):
+    if existing:
         logger.warning(f"Email already exists: {user_data.email}")
         raise AlreadyExists("Email", user_data.email)
 
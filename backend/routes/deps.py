@@ -1,9 +1,11 @@
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+import jwt
 from fastapi import Cookie, Depends, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
@@ -18,6 +20,12 @@ logger = logger.bind(module="deps")
 
 security = HTTPBearer(auto_error=False)
 
+# Verified payloads by token string; a session sends the same cookie on every
+# request, so the signature is checked once per TOKEN_CACHE_TTL instead
+TOKEN_CACHE_SIZE = 10000
+TOKEN_CACHE_TTL = 60
+_token_cache: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
@@ -35,21 +43,36 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
     )
 
-    logger.debug(f"Created access token for user: {data.get('sub')}")
+    logger.debug("Created access token for user: %s", data.get("sub"))
     return encoded_jwt
 
 
 def decode_token(token: str) -> dict:
-    """Decode JWT token"""
+    """Decode JWT token, reusing a recent verification of the same token"""
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        payload, expires_at = cached
+        if now < expires_at:
+            _token_cache.move_to_end(token)
+            return payload
+        del _token_cache[token]
+
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        return payload
-    except JWTError as e:
-        logger.warning(f"Failed to decode token: {e}")
+    except jwt.PyJWTError as e:
+        logger.warning("Failed to decode token: %s", e)
         raise Unauthorized("Could not validate credentials")
 
+    # Never served past the token's own expiry
+    expires_at = min(payload.get("exp", now), now + TOKEN_CACHE_TTL)
+    _token_cache[token] = (payload, expires_at)
+    if len(_token_cache) > TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+    return payload
+
 
 async def get_current_user(
     access_token: Optional[str] = Cookie(None),
@@ -73,12 +96,14 @@ async def get_current_user(
         logger.warning("Token payload missing 'sub' field")
         raise Unauthorized("Could not validate credentials")
 
-    user = await user_crud.get_by_username(db, username=username)
+    # Looked up once per request: FastAPI reuses a dependency's result for
+    # every route and dependency that asks for it
+    user = await user_crud.get_by_username_cached(db, username=username)
     if user is None:
-        logger.warning(f"User not found: {username}")
+        logger.warning("User not found: %s", username)
         raise Unauthorized("User not found")
 
-    logger.debug(f"Authenticated user: {username}")
+    logger.debug("Authenticated user: %s", username)
     return user
 
 
@@ -107,6 +107,7 @@ async def create_movie(
 @router.get("/movies", response_model=List[MovieResponse])
 async def get_movies(
     skip: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -114,7 +115,11 @@ async def get_movies(
     """Get all movies"""
     logger.debug(f"User {current_user.username} fetching movies")
     return await media_crud.get_all(
-        db, media_type=MediaTypeEnum.MOVIE, skip=skip, limit=limit
+        db,
+        media_type=MediaTypeEnum.MOVIE,
+        skip=skip,
+        after_id=after_id,
+        limit=limit,
     )
 
 
@@ -178,6 +183,7 @@ async def create_series(
 @router.get("/series", response_model=List[SeriesResponse])
 async def get_series_list(
     skip: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -185,7 +191,11 @@ async def get_series_list(
     """Get all series"""
     logger.debug(f"User {current_user.username} fetching series")
     return await media_crud.get_all(
-        db, media_type=MediaTypeEnum.SERIES, skip=skip, limit=limit
+        db,
+        media_type=MediaTypeEnum.SERIES,
+        skip=skip,
+        after_id=after_id,
+        limit=limit,
     )
 
 
@@ -251,6 +261,7 @@ async def create_anime(
 @router.get("/anime", response_model=List[AnimeResponse])
 async def get_anime_list(
     skip: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -258,7 +269,11 @@ async def get_anime_list(
     """Get all anime"""
     logger.debug(f"User {current_user.username} fetching anime")
     return await media_crud.get_all(
-        db, media_type=MediaTypeEnum.ANIME, skip=skip, limit=limit
+        db,
+        media_type=MediaTypeEnum.ANIME,
+        skip=skip,
+        after_id=after_id,
+        limit=limit,
     )
 
 
@@ -322,6 +337,7 @@ async def create_manga(
 @router.get("/manga", response_model=List[MangaResponse])
 async def get_manga_list(
     skip: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -329,7 +345,11 @@ async def get_manga_list(
     """Get all manga"""
     logger.debug(f"User {current_user.username} fetching manga")
     return await media_crud.get_all(
-        db, media_type=MediaTypeEnum.MANGA, skip=skip, limit=limit
+        db,
+        media_type=MediaTypeEnum.MANGA,
+        skip=skip,
+        after_id=after_id,
+        limit=limit,
     )
 
 
@@ -391,6 +411,7 @@ async def create_book(
 @router.get("/books", response_model=List[BookResponse])
 async def get_books(
     skip: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -398,7 +419,11 @@ async def get_books(
     """Get all books"""
     logger.debug(f"User {current_user.username} fetching books")
     return await media_crud.get_all(
-        db, media_type=MediaTypeEnum.BOOK, skip=skip, limit=limit
+        db,
+        media_type=MediaTypeEnum.BOOK,
+        skip=skip,
+        after_id=after_id,
+        limit=limit,
     )
 
 
@@ -460,6 +485,7 @@ async def create_game(
 @router.get("/games", response_model=List[GameResponse])
 async def get_games(
     skip: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -467,7 +493,11 @@ async def get_games(
     """Get all games"""
     logger.debug(f"User {current_user.username} fetching games")
     return await media_crud.get_all(
-        db, media_type=MediaTypeEnum.GAME, skip=skip, limit=limit
+        db,
+        media_type=MediaTypeEnum.GAME,
+        skip=skip,
+        after_id=after_id,
+        limit=limit,
     )
 
 
@@ -527,7 +557,10 @@ async def search_media(
 ):
     """Search across all media types"""
     logger.info(f"User {current_user.username} searching for: {q}")
-    results = await media_crud.search(db, query=q, media_type=media_type, limit=limit)
+    # Search results are a summary list and carry no tags
+    results = await media_crud.search(
+        db, query=q, media_type=media_type, limit=limit, load_tags=False
+    )
     return results
 
 
@@ -30,7 +30,9 @@ async def create_tracking(
 ):
     """Create a new tracking entry"""
     logger.info(
-        f"User {current_user.username} creating tracking for media_id: {tracking.media_id}"
+        "User %s creating tracking for media_id: %s",
+        current_user.username,
+        tracking.media_id,
     )
 
     return await tracking_crud.create(db, obj_in=tracking, user_id=current_user.id)
@@ -42,14 +44,18 @@ async def get_user_tracking(
     media_type: Optional[MediaTypeEnum] = None,
     sort_by: Optional[str] = None,
     skip: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all tracking entries for current user"""
     logger.debug(
-        f"User {current_user.username} fetching tracking "
-        f"(status: {status}, type: {media_type}, sort_by: {sort_by})"
+        "User %s fetching tracking (status: %s, type: %s, sort_by: %s)",
+        current_user.username,
+        status,
+        media_type,
+        sort_by,
     )
 
     return await tracking_crud.get_by_user(
@@ -59,6 +65,7 @@ async def get_user_tracking(
         media_type=media_type,
         sort_by=sort_by,
         skip=skip,
+        after_id=after_id,
         limit=limit,
     )
 
@@ -67,18 +74,20 @@ async def get_user_tracking(
 async def get_favorites(
     media_type: Optional[MediaTypeEnum] = None,
     skip: int = Query(0, ge=0),
+    after_id: Optional[int] = Query(None, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get user's favorite media"""
-    logger.debug(f"User {current_user.username} fetching favorites")
+    logger.debug("User %s fetching favorites", current_user.username)
 
     return await tracking_crud.get_favorites(
         db,
         user_id=current_user.id,
         media_type=media_type,
         skip=skip,
+        after_id=after_id,
         limit=limit,
     )
 
@@ -90,7 +99,7 @@ async def get_statistics(
     current_user: User = Depends(get_current_user),
 ):
     """Get tracking statistics for current user"""
-    logger.debug(f"User {current_user.username} fetching statistics")
+    logger.debug("User %s fetching statistics", current_user.username)
 
     return await tracking_crud.get_statistics(
         db, user_id=current_user.id, media_type=media_type
@@ -105,7 +114,7 @@ async def get_tracking_by_media(
 ):
     """Get tracking entry for specific media"""
     logger.debug(
-        f"User {current_user.username} fetching tracking for media_id: {media_id}"
+        "User %s fetching tracking for media_id: %s", current_user.username, media_id
     )
 
     tracking = await tracking_crud.get_by_user_and_media(
@@ -128,7 +137,7 @@ async def update_tracking(
 ):
     """Update tracking entry"""
     logger.info(
-        f"User {current_user.username} updating tracking for media_id: {media_id}"
+        "User %s updating tracking for media_id: %s", current_user.username, media_id
     )
 
     tracking = await tracking_crud.get_by_user_and_media(
@@ -149,7 +158,7 @@ async def delete_tracking(
 ):
     """Delete tracking entry"""
     logger.info(
-        f"User {current_user.username} deleting tracking for media_id: {media_id}"
+        "User %s deleting tracking for media_id: %s", current_user.username, media_id
     )
 
     if not await tracking_crud.delete(db, user_id=current_user.id, media_id=media_id):
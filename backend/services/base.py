@@ -1,3 +1,5 @@
+import asyncio
+import json
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -9,10 +11,18 @@ from core.logger import get_logger
 
 logger = get_logger("services")
 
+# Bodies larger than this (or of unknown size) are read incrementally
+STREAM_THRESHOLD = 64 * 1024
+STREAM_CHUNK_SIZE = 16 * 1024
+
 
 class BaseAPIService(ABC):
     """Base class for external API services using aiohttp."""
 
+    # In-flight GET requests keyed by cache key, shared across instances so
+    # concurrent requests for the same resource hit the upstream API once
+    _inflight: Dict[str, asyncio.Future] = {}
+
     def __init__(
         self,
         base_url: str,
@@ -35,6 +45,18 @@ class BaseAPIService(ABC):
             )
         return self._session
 
+    async def _read_json(self, response: aiohttp.ClientResponse) -> Any:
+        """Decode a JSON response body, streaming large payloads in chunks."""
+        length = response.content_length
+        if length is not None and length <= STREAM_THRESHOLD:
+            body = await response.read()
+        else:
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                body.extend(chunk)
+        logger.debug(f"Response received: {len(body)} bytes")
+        return json.loads(body)
+
     async def _get(
         self,
         endpoint: str,
@@ -53,12 +75,36 @@ class BaseAPIService(ABC):
         if cached_data:
             return cached_data
 
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            logger.debug(f"Joining in-flight request for {cache_key}")
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            data = await self._fetch(url, params, cache_key, cache_ttl)
+            future.set_result(data)
+            return data
+        finally:
+            if not future.done():
+                # Leader was cancelled; release waiters with a miss
+                future.set_result(None)
+            self._inflight.pop(cache_key, None)
+
+    async def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        cache_key: str,
+        cache_ttl: Optional[int],
+    ) -> Optional[Dict[str, Any]]:
+        """Perform the GET request and store a successful response in cache."""
         try:
             logger.debug(f"GET {url} with params: {params}")
             async with self.session.get(url, params=params) as response:
                 response.raise_for_status()
-                data = await response.json()
-                logger.debug(f"Response received: {len(str(data))} bytes")
+                data = await self._read_json(response)
 
                 # Store in cache
                 final_ttl = cache_ttl if cache_ttl is not None else settings.CACHE_TTL
@@ -88,8 +134,7 @@ class BaseAPIService(ABC):
             logger.debug(f"POST {url}")
             async with self.session.post(url, data=data, json=json) as response:
                 response.raise_for_status()
-                response_data = await response.json()
-                logger.debug(f"Response received: {len(str(response_data))} bytes")
+                response_data = await self._read_json(response)
                 return response_data
 
         except aiohttp.ClientResponseError as e:
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from typing import List, Optional
 
@@ -8,6 +9,9 @@ from .base import BaseAPIService, logger
 
 logger = logger.bind(module="openlibrary")
 
+# Cap on concurrent author lookups per work to stay polite with Open Library
+AUTHOR_FETCH_CONCURRENCY = 5
+
 
 class OpenLibraryService(BaseAPIService):
     """Service for Open Library API."""
@@ -38,17 +42,24 @@ class OpenLibraryService(BaseAPIService):
         data = await self._get(f"works/{media_id}.json", cache_ttl=86400)
         if data:
             logger.debug(f"Found book: {data.get('title', 'Unknown')}")
-            authors = []
-            for author in data["authors"]:
-                author_data = await self._get(f"{author['author']['key']}.json", cache_ttl=86400)
-                if author_data:
-                    authors.append(author_data["name"])
-
-            data["author_name"] = authors
+            data["author_name"] = await self._get_author_names(
+                [author["author"]["key"] for author in data.get("authors", [])]
+            )
         else:
             logger.warning(f"Book not found with ID: {media_id}")
         return data
 
+    async def _get_author_names(self, author_keys: List[str]) -> List[str]:
+        """Fetch author records concurrently, preserving the input order."""
+        semaphore = asyncio.Semaphore(AUTHOR_FETCH_CONCURRENCY)
+
+        async def fetch(key: str) -> Optional[dict]:
+            async with semaphore:
+                return await self._get(f"{key}.json", cache_ttl=86400)
+
+        results = await asyncio.gather(*(fetch(key) for key in author_keys))
+        return [author_data["name"] for author_data in results if author_data]
+
     @cached("openlibrary:isbn", ttl=7200)
     async def search_by_isbn(self, isbn: str) -> Optional[dict]:
         """Search by ISBN."""
@@ -1,4 +1,5 @@
-from datetime import datetime
+import re
+from datetime import date
 from typing import List, Literal, Optional
 
 from core.cache import cached
@@ -10,6 +11,19 @@ from .base import BaseAPIService, logger
 
 logger = logger.bind(module="tmdb")
 
+# TMDB dates are "YYYY-MM-DD" or an empty string for unreleased titles
+_TMDB_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse a TMDB date, rejecting malformed values without raising."""
+    if not isinstance(value, str) or not _TMDB_DATE_RE.match(value):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
 
 class TMDBService(BaseAPIService):
     """Service for The Movie Database API."""
@@ -26,9 +40,11 @@ class TMDBService(BaseAPIService):
         )
 
     def _build_params(self, **kwargs) -> dict:
-        """Build params with API key."""
-        params = {**kwargs}
-        return {k: v for k, v in params.items() if v is not None}
+        """Build request params, dropping None values."""
+        # kwargs is already a fresh dict; only copy when something must be dropped
+        if None not in kwargs.values():
+            return kwargs
+        return {k: v for k, v in kwargs.items() if v is not None}
 
     @cached("tmdb:search", ttl=3600)
     async def search(
@@ -66,14 +82,7 @@ class TMDBService(BaseAPIService):
 
     def to_movie_create(self, tmdb_data: dict) -> MovieCreate:
         """Convert TMDB movie data to MovieCreate schema."""
-        release_date = None
-        if tmdb_data.get("release_date"):
-            try:
-                release_date = datetime.strptime(
-                    tmdb_data["release_date"], "%Y-%m-%d"
-                ).date()
-            except (ValueError, TypeError):
-                pass
+        release_date = _parse_date(tmdb_data.get("release_date"))
 
         logger.debug(
             f"Converting TMDB movie data for: {tmdb_data.get('title', 'Unknown')}"
@@ -114,14 +123,7 @@ class TMDBService(BaseAPIService):
             "In Production": MediaStatusEnum.AIRING,
         }
 
-        first_air_date = None
-        if tmdb_data.get("first_air_date"):
-            try:
-                first_air_date = datetime.strptime(
-                    tmdb_data["first_air_date"], "%Y-%m-%d"
-                ).date()
-            except (ValueError, TypeError):
-                pass
+        first_air_date = _parse_date(tmdb_data.get("first_air_date"))
 
         logger.debug(
             f"Converting TMDB series data for: {tmdb_data.get('name', 'Unknown')}"
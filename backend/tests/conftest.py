@@ -9,6 +9,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from core.config import settings
 settings.TESTING = True
+# Minimum bcrypt cost: the tests hash many passwords and need no strength
+settings.BCRYPT_ROUNDS = 4
 
 import pytest
 import pytest_asyncio
@@ -16,7 +18,7 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
                                     async_sessionmaker, create_async_engine)
 
-from core.database import Base, get_db
+from core.database import Base, enable_sqlite_foreign_keys, get_db
 from crud import user_crud
 from main import app
 from models import User
@@ -27,6 +29,7 @@ async def engine() -> AsyncGenerator[AsyncEngine]:
     """Create test database engine"""
     test_db_url = "sqlite+aiosqlite:///:memory:"
     engine = create_async_engine(test_db_url, echo=False)
+    enable_sqlite_foreign_keys(engine)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -66,6 +69,9 @@ async def clean_db(engine) -> AsyncGenerator[AsyncSession, None]:
         for table in reversed(Base.metadata.sorted_tables):
             await session.execute(table.delete())
         await session.commit()
+        # Rows were removed behind the CRUD layer's back
+        user_crud._user_cache.clear()
+        user_crud._cached_usernames.clear()
 
 
 @pytest.fixture
@@ -4,8 +4,8 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.exceptions import AlreadyExists, PermissionDenied
-from crud import media_crud, tracking_crud, user_crud
-from models import MediaTypeEnum, TrackingStatusEnum
+from crud import media_crud, tag_crud, tracking_crud, user_crud
+from models import MediaTypeEnum, Tag, TrackingStatusEnum
 from schemas import (AnimeCreate, BookCreate, GameCreate, MangaCreate,
                      MovieCreate, SeriesCreate, TrackingCreate)
 
@@ -212,6 +212,26 @@ class TestMediaCRUD:
         assert movie1.id == movie2.id
         assert movie1.title == movie2.title
 
+    @pytest.mark.asyncio
+    async def test_create_duplicate_external_media_keeps_pending_work(
+        self, clean_db: AsyncSession
+    ):
+        """Test a rejected duplicate does not discard the session's other work"""
+        movie_data = MovieCreate(
+            title="Duplicate Movie", external_id="duplicate123", external_source="tmdb"
+        )
+        movie1 = await media_crud.create_movie(db=clean_db, obj_in=movie_data)
+
+        pending_tag = Tag(name="Pending", slug="pending")
+        clean_db.add(pending_tag)
+
+        movie2 = await media_crud.create_movie(db=clean_db, obj_in=movie_data)
+
+        assert movie2.id == movie1.id
+        assert pending_tag in clean_db
+        await clean_db.commit()
+        assert await tag_crud.get_by_slug(clean_db, slug="pending") is pending_tag
+
     @pytest.mark.asyncio
     async def test_get_media_by_id(self, clean_db: AsyncSession):
         """Test getting media by ID"""
@@ -240,6 +260,27 @@ class TestMediaCRUD:
         )
         assert fetched_wrong_type is None
 
+    @pytest.mark.asyncio
+    async def test_get_media_by_ids(self, clean_db: AsyncSession):
+        """Test getting several media by ID in one call"""
+        movie = await media_crud.create_movie(
+            db=clean_db, obj_in=MovieCreate(title="Movie", tags=["action"])
+        )
+        series = await media_crud.create_series(
+            db=clean_db, obj_in=SeriesCreate(title="Series")
+        )
+
+        fetched = await media_crud.get_by_ids(
+            db=clean_db, ids=[movie.id, series.id, 999]
+        )
+        assert set(fetched) == {movie.id, series.id}
+        assert [a.tag.name for a in fetched[movie.id].tag_associations] == ["action"]
+
+        fetched_movies = await media_crud.get_by_ids(
+            db=clean_db, ids=[movie.id, series.id], media_type=MediaTypeEnum.MOVIE
+        )
+        assert set(fetched_movies) == {movie.id}
+
     @pytest.mark.asyncio
     async def test_get_all_media(self, clean_db: AsyncSession):
         """Test getting all media"""
@@ -292,6 +333,22 @@ class TestMediaCRUD:
         page3 = await media_crud.get_all(db=clean_db, skip=4, limit=2)
         assert len(page3) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_all_with_keyset_pagination(self, clean_db: AsyncSession):
+        """Test keyset pagination with after_id"""
+        for i in range(5):
+            await media_crud.create_movie(
+                db=clean_db, obj_in=MovieCreate(title=f"Movie {i}")
+            )
+
+        page1 = await media_crud.get_all(db=clean_db, after_id=0, limit=3)
+        assert [m.title for m in page1] == ["Movie 0", "Movie 1", "Movie 2"]
+
+        page2 = await media_crud.get_all(
+            db=clean_db, after_id=page1[-1].id, limit=3
+        )
+        assert [m.title for m in page2] == ["Movie 3", "Movie 4"]
+
     @pytest.mark.asyncio
     async def test_search_media_by_title(self, clean_db: AsyncSession):
         """Test searching media by title"""
@@ -341,6 +398,37 @@ class TestMediaCRUD:
         results = await media_crud.search(db=clean_db, query="MATRIX")
         assert len(results) == 1
 
+    @pytest.mark.asyncio
+    async def test_search_escapes_like_wildcards(self, clean_db: AsyncSession):
+        """Test that % and _ in the query are matched literally"""
+        await media_crud.create_movie(
+            db=clean_db, obj_in=MovieCreate(title="100% Wolf", description="Comedy")
+        )
+        await media_crud.create_movie(
+            db=clean_db, obj_in=MovieCreate(title="1000 Wolves", description="Drama")
+        )
+
+        results = await media_crud.search(db=clean_db, query="100%")
+        assert [m.title for m in results] == ["100% Wolf"]
+
+        results = await media_crud.search(db=clean_db, query="10_0")
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_search_short_query_matches_title_prefix(
+        self, clean_db: AsyncSession
+    ):
+        """Test that queries shorter than a trigram only match title prefixes"""
+        await media_crud.create_movie(
+            db=clean_db, obj_in=MovieCreate(title="Up", description="Balloons")
+        )
+        await media_crud.create_movie(
+            db=clean_db, obj_in=MovieCreate(title="Pop Star", description="Upbeat")
+        )
+
+        results = await media_crud.search(db=clean_db, query="up")
+        assert [m.title for m in results] == ["Up"]
+
     @pytest.mark.asyncio
     async def test_get_by_external_id(self, clean_db: AsyncSession):
         """Test getting media by external ID"""
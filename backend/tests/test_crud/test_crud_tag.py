@@ -74,6 +74,18 @@ class TestTagCRUD:
         assert fetched is not None
         assert fetched.id == tag.id
 
+    @pytest.mark.asyncio
+    async def test_get_tag_by_name_after_rename(self, clean_db: AsyncSession):
+        """Test a renamed tag is not returned under its old name"""
+        tag = await tag_crud.get_or_create(db=clean_db, name="Mystery")
+        await tag_crud.update(db=clean_db, db_obj=tag, obj_in={"name": "Noir"})
+
+        assert await tag_crud.get_by_name(db=clean_db, name="Mystery") is None
+        fetched = await tag_crud.get_by_name(db=clean_db, name="noir")
+
+        assert fetched is not None
+        assert fetched.id == tag.id
+
     @pytest.mark.asyncio
     async def test_get_tag_by_slug(self, clean_db: AsyncSession):
         """Test getting tag by slug"""
@@ -185,6 +197,23 @@ class TestTagCRUD:
         all_tags = await tag_crud.get_tags_for_media(db=clean_db, media_id=movie.id)
         assert len(all_tags) == 2
 
+    @pytest.mark.asyncio
+    async def test_add_tags_with_same_slug(self, clean_db: AsyncSession):
+        """Test names that slugify alike resolve to one tag"""
+        existing = await tag_crud.get_or_create(db=clean_db, name="sci-fi")
+        movie_data = MovieCreate(title="Test Movie", description="A test")
+        movie = await media_crud.create_movie(db=clean_db, obj_in=movie_data)
+
+        tags = await tag_crud.add_tags_to_media(
+            db=clean_db,
+            media_id=movie.id,
+            media_type=MediaTypeEnum.MOVIE,
+            tag_names=["Sci Fi", "sci fi!", "drama"],
+        )
+
+        assert [tag.name for tag in tags] == ["sci-fi", "drama"]
+        assert tags[0].id == existing.id
+
     @pytest.mark.asyncio
     async def test_add_tags_with_whitespace(self, clean_db: AsyncSession):
         """Test adding tags with whitespace"""
@@ -257,6 +257,38 @@ class TestTrackingCRUD:
         )
         assert len(page3) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_by_user_with_keyset_pagination(
+        self, test_user, clean_db: AsyncSession
+    ):
+        """Test keyset pagination returns entries newest first"""
+        ids = []
+        for i in range(5):
+            movie = await media_crud.create_movie(
+                db=clean_db,
+                obj_in=MovieCreate(title=f"Movie {i}", description="Test"),
+            )
+            tracking = await tracking_crud.create(
+                db=clean_db,
+                obj_in=TrackingCreate(
+                    media_id=movie.id,
+                    media_type=MediaTypeEnum.MOVIE,
+                    status=TrackingStatusEnum.PLANNED,
+                ),
+                user_id=test_user.id,
+            )
+            ids.append(tracking.id)
+
+        page1 = await tracking_crud.get_by_user(
+            db=clean_db, user_id=test_user.id, after_id=ids[-1] + 1, limit=3
+        )
+        assert [t.id for t in page1] == ids[:1:-1]
+
+        page2 = await tracking_crud.get_by_user(
+            db=clean_db, user_id=test_user.id, after_id=page1[-1].id, limit=3
+        )
+        assert [t.id for t in page2] == ids[1::-1]
+
     @pytest.mark.asyncio
     async def test_get_favorites(self, test_user, clean_db: AsyncSession):
         """Test getting user's favorite media"""
@@ -517,6 +549,35 @@ class TestTrackingCRUD:
         assert stats["favorites"] == 1
         assert stats["average_rating"] == 7.375
 
+    @pytest.mark.asyncio
+    async def test_get_statistics_after_custom_media_deleted(
+        self, test_user, clean_db: AsyncSession
+    ):
+        """Test deleting tracked custom media clears the owner's cached stats"""
+        movie = await media_crud.create_movie(
+            db=clean_db,
+            obj_in=MovieCreate(title="Custom Movie", is_custom=True),
+            user_id=test_user.id,
+        )
+        await tracking_crud.create(
+            db=clean_db,
+            obj_in=TrackingCreate(
+                media_id=movie.id,
+                media_type=MediaTypeEnum.MOVIE,
+                status=TrackingStatusEnum.COMPLETED,
+            ),
+            user_id=test_user.id,
+        )
+
+        stats = await tracking_crud.get_statistics(db=clean_db, user_id=test_user.id)
+        assert stats["total"] == 1
+
+        assert await media_crud.delete(db=clean_db, id=movie.id, user_id=test_user.id)
+
+        stats = await tracking_crud.get_statistics(db=clean_db, user_id=test_user.id)
+        assert stats["total"] == 0
+        assert stats["completed"] == 0
+
     @pytest.mark.asyncio
     async def test_get_statistics_filtered_by_media_type(
         self, test_user, clean_db: AsyncSession
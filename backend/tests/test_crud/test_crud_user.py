@@ -1,7 +1,9 @@
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from crud import user_crud
+from models import User
 
 
 @pytest.mark.crud
@@ -77,6 +79,88 @@ class TestUserCRUD:
         assert fetched_user.id == user.id
         assert fetched_user.username == "testuser"
 
+    @pytest.mark.asyncio
+    async def test_get_user_by_username_does_not_lazy_load(
+        self, clean_db: AsyncSession
+    ):
+        """Test relationships of a fetched user must be loaded explicitly"""
+        await user_crud.create(
+            db=clean_db,
+            username="testuser",
+            email="test@example.com",
+            password="testpassword123",
+        )
+        clean_db.expunge_all()
+
+        fetched_user = await user_crud.get_by_username(db=clean_db, username="testuser")
+
+        with pytest.raises(InvalidRequestError, match="lazy=.raise."):
+            fetched_user.tracking_entries
+
+    @pytest.mark.asyncio
+    async def test_get_user_by_username_cached(self, clean_db: AsyncSession):
+        """Test cached lookups attach the user and are evicted on rename"""
+        user = await user_crud.create(
+            db=clean_db,
+            username="testuser",
+            email="test@example.com",
+            password="testpassword123",
+        )
+
+        await user_crud.get_by_username_cached(db=clean_db, username="testuser")
+        cached_values, _ = user_crud._user_cache["testuser"]
+        assert "hashed_password" not in cached_values
+        clean_db.expunge_all()
+
+        fetched_user = await user_crud.get_by_username_cached(
+            db=clean_db, username="testuser"
+        )
+        assert fetched_user is not None
+        assert fetched_user in clean_db
+        assert fetched_user.id == user.id
+        assert fetched_user.email == "test@example.com"
+
+        await user_crud.update(db=clean_db, user=fetched_user, username="renamed")
+
+        assert (
+            await user_crud.get_by_username_cached(db=clean_db, username="testuser")
+            is None
+        )
+        assert user.id not in user_crud._cached_usernames
+
+    @pytest.mark.asyncio
+    async def test_get_user_by_username_or_email(self, clean_db: AsyncSession):
+        """Test getting user by username or email prefers the username match"""
+        user = await user_crud.create(
+            db=clean_db,
+            username="testuser",
+            email="test@example.com",
+            password="testpassword123",
+        )
+        other = await user_crud.create(
+            db=clean_db,
+            username="otheruser",
+            email="other@example.com",
+            password="testpassword123",
+        )
+
+        fetched_user = await user_crud.get_by_username_or_email(
+            db=clean_db, username="nobody", email="test@example.com"
+        )
+        assert fetched_user is not None
+        assert fetched_user.id == user.id
+
+        fetched_user = await user_crud.get_by_username_or_email(
+            db=clean_db, username="otheruser", email="test@example.com"
+        )
+        assert fetched_user is not None
+        assert fetched_user.id == other.id
+
+        fetched_user = await user_crud.get_by_username_or_email(
+            db=clean_db, username="nobody", email="nobody@example.com"
+        )
+        assert fetched_user is None
+
     @pytest.mark.asyncio
     async def test_get_nonexistent_user(self, clean_db: AsyncSession):
         """Test getting non-existent user returns None"""
@@ -139,6 +223,27 @@ class TestUserCRUD:
         users = await user_crud.get_multi(db=clean_db, skip=4, limit=2)
         assert len(users) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_multi_with_keyset_pagination(self, clean_db: AsyncSession):
+        """Test keyset pagination and column projection"""
+        for i in range(5):
+            await user_crud.create(
+                db=clean_db,
+                username=f"user{i}",
+                email=f"user{i}@example.com",
+                password="password123",
+            )
+
+        first_page = await user_crud.get_multi(
+            db=clean_db, after_id=0, limit=3, only=(User.id, User.username)
+        )
+        assert [u.username for u in first_page] == ["user0", "user1", "user2"]
+
+        second_page = await user_crud.get_multi(
+            db=clean_db, after_id=first_page[-1].id, limit=3
+        )
+        assert [u.username for u in second_page] == ["user3", "user4"]
+
     @pytest.mark.asyncio
     async def test_update_user_username(self, clean_db: AsyncSession):
         """Test updating user username"""
@@ -144,3 +144,26 @@ class TestAuthRoutes:
         response = await client.get("/api/auth/me")
 
         assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_get_current_user_repeated_token(self, client: AsyncClient, test_user):
+        """Test a reused token keeps working and a tampered one is still rejected"""
+        login_response = await client.post(
+            "/api/auth/login",
+            json={"username": test_user.username, "password": "testpass123"},
+        )
+        token = login_response.json()["access_token"]
+        # The cookie takes precedence over the header
+        client.cookies.clear()
+
+        for _ in range(2):
+            response = await client.get(
+                "/api/auth/me", headers={"Authorization": f"Bearer {token}"}
+            )
+            assert response.status_code == 200
+            assert response.json()["username"] == test_user.username
+
+        response = await client.get(
+            "/api/auth/me", headers={"Authorization": f"Bearer {token}x"}
+        )
+        assert response.status_code == 401
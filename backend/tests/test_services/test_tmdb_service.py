@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -174,3 +175,24 @@ class TestTMDBService:
                 results = await service.search("Inception", media_type="movie")
                 assert results == fixture_data
                 mock_cache_get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_are_deduplicated(self, load_fixture):
+        """Test that concurrent identical GETs share one upstream request"""
+        fixture_data = load_fixture("tmdb", "movie_details.json")
+
+        async def slow_fetch(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return fixture_data
+
+        with patch("services.base.cache.get", new_callable=AsyncMock) as mock_cache_get, \
+                patch.object(TMDBService, "_fetch", side_effect=slow_fetch) as mock_fetch:
+            mock_cache_get.return_value = None
+
+            async with TMDBService() as service:
+                results = await asyncio.gather(
+                    *[service._get("movie/27205", {"language": "en"}) for _ in range(5)]
+                )
+
+            assert all(result == fixture_data for result in results)
+            assert mock_fetch.call_count == 1
@@ -30,6 +30,14 @@ function getCookie(name: string): string | null {
   );
 }
 
+// Passing the last seen id pages by keyset, which stays fast at any depth
+function mediaPageParams(skip: number, limit: number, afterId?: number): URLSearchParams {
+  const params = new URLSearchParams({ limit: limit.toString() });
+  if (afterId !== undefined) params.append("after_id", afterId.toString());
+  else params.append("skip", skip.toString());
+  return params;
+}
+
 class ApiClient {
   private async request<T>(
     endpoint: string,
@@ -110,8 +118,8 @@ class ApiClient {
   }
 
   // Media endpoints
-  async getMovies(skip = 0, limit = 100): Promise<AnyMedia[]> {
-    return this.request<AnyMedia[]>(`/api/media/movies?skip=${skip}&limit=${limit}`);
+  async getMovies(skip = 0, limit = 100, afterId?: number): Promise<AnyMedia[]> {
+    return this.request<AnyMedia[]>(`/api/media/movies?${mediaPageParams(skip, limit, afterId)}`);
   }
 
   async createMovie(data: any): Promise<AnyMedia> {
@@ -198,24 +206,24 @@ class ApiClient {
     });
   }
 
-  async getSeries(skip = 0, limit = 100): Promise<AnyMedia[]> {
-    return this.request<AnyMedia[]>(`/api/media/series?skip=${skip}&limit=${limit}`);
+  async getSeries(skip = 0, limit = 100, afterId?: number): Promise<AnyMedia[]> {
+    return this.request<AnyMedia[]>(`/api/media/series?${mediaPageParams(skip, limit, afterId)}`);
   }
 
-  async getAnime(skip = 0, limit = 100): Promise<AnyMedia[]> {
-    return this.request<AnyMedia[]>(`/api/media/anime?skip=${skip}&limit=${limit}`);
+  async getAnime(skip = 0, limit = 100, afterId?: number): Promise<AnyMedia[]> {
+    return this.request<AnyMedia[]>(`/api/media/anime?${mediaPageParams(skip, limit, afterId)}`);
   }
 
-  async getManga(skip = 0, limit = 100): Promise<AnyMedia[]> {
-    return this.request<AnyMedia[]>(`/api/media/manga?skip=${skip}&limit=${limit}`);
+  async getManga(skip = 0, limit = 100, afterId?: number): Promise<AnyMedia[]> {
+    return this.request<AnyMedia[]>(`/api/media/manga?${mediaPageParams(skip, limit, afterId)}`);
   }
 
-  async getBooks(skip = 0, limit = 100): Promise<AnyMedia[]> {
-    return this.request<AnyMedia[]>(`/api/media/books?skip=${skip}&limit=${limit}`);
+  async getBooks(skip = 0, limit = 100, afterId?: number): Promise<AnyMedia[]> {
+    return this.request<AnyMedia[]>(`/api/media/books?${mediaPageParams(skip, limit, afterId)}`);
   }
 
-  async getGames(skip = 0, limit = 100): Promise<AnyMedia[]> {
-    return this.request<AnyMedia[]>(`/api/media/games?skip=${skip}&limit=${limit}`);
+  async getGames(skip = 0, limit = 100, afterId?: number): Promise<AnyMedia[]> {
+    return this.request<AnyMedia[]>(`/api/media/games?${mediaPageParams(skip, limit, afterId)}`);
   }
 
   async searchMedia(query: string, mediaType?: MediaType, limit = 100): Promise<AnyMedia[]> {